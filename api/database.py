@@ -6,6 +6,9 @@ SQLite database schema for feature storage using SQLAlchemy.
 """
 
 import sys
+import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Generator, Optional
@@ -29,6 +32,7 @@ from sqlalchemy import (
     event,
     text,
 )
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Session, relationship, sessionmaker
 from sqlalchemy.types import JSON
 
@@ -291,20 +295,34 @@ def _is_network_path(path: Path) -> bool:
         except (AttributeError, OSError):
             pass
     else:
-        # Unix: Check mount type via /proc/mounts or mount command
+        # Unix: Find the mount containing our path via /proc/mounts. The
+        # longest mount point that is a whole-component prefix of the path
+        # wins, so a local mount nested under a network one (or vice versa)
+        # is classified by the filesystem the path actually lives on.
         try:
+            best_mount_len = -1
+            best_fs_type = ""
             with open("/proc/mounts", "r") as f:
-                mounts = f.read()
-                # Check each mount point to find which one contains our path
-                for line in mounts.splitlines():
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        mount_point = parts[1]
-                        fs_type = parts[2]
-                        # Check if path is under this mount point and if it's a network FS
-                        if path_str.startswith(mount_point):
-                            if fs_type in ("nfs", "nfs4", "cifs", "smbfs", "fuse.sshfs"):
-                                return True
+                for line in f:
+                    # Only device, mount point and fs type are needed; bound
+                    # the split so mount options aren't tokenized
+                    parts = line.split(None, 3)
+                    if len(parts) < 3:
+                        continue
+                    # /proc/mounts octal-escapes spaces in mount points
+                    mount_point = parts[1].replace("\\040", " ")
+                    # Later entries for the same mount point shadow earlier ones
+                    if len(mount_point) < best_mount_len:
+                        continue
+                    if (
+                        mount_point == "/"
+                        or path_str == mount_point
+                        or path_str.startswith(mount_point.rstrip("/") + "/")
+                    ):
+                        best_mount_len = len(mount_point)
+                        best_fs_type = parts[2]
+            if best_fs_type in ("nfs", "nfs4", "cifs", "smbfs", "fuse.sshfs"):
+                return True
         except (FileNotFoundError, PermissionError):
             pass
 
@@ -404,8 +422,20 @@ def create_database(project_dir: Path) -> tuple:
     """
     cache_key = project_dir.as_posix()
 
-    if cache_key in _engine_cache:
-        return _engine_cache[cache_key]
+    with _engine_cache_lock:
+        cached = _engine_cache.get(cache_key)
+        if cached is not None:
+            _engine_cache.move_to_end(cache_key)
+            return cached
+
+        # An evicted engine that is still referenced (e.g. via a caller's
+        # SessionLocal) is revived rather than opening a second engine on
+        # the same file; its schema is already set up
+        revived = _evicted_engines.pop(cache_key, None)
+        if revived is not None:
+            SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=revived)
+            _cache_engine_locked(cache_key, revived, SessionLocal)
+            return revived, SessionLocal
 
     db_url = get_database_url(project_dir)
 
@@ -456,29 +486,57 @@ def create_database(project_dir: Path) -> tuple:
 
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    # Cache the engine and session maker
-    _engine_cache[cache_key] = (engine, SessionLocal)
+    with _engine_cache_lock:
+        # Another thread may have created this project's engine meanwhile;
+        # keep theirs so there is only ever one engine per database file
+        cached = _engine_cache.get(cache_key)
+        if cached is not None:
+            _engine_cache.move_to_end(cache_key)
+            engine.dispose()
+            return cached
+        _cache_engine_locked(cache_key, engine, SessionLocal)
 
     return engine, SessionLocal
 
 
+def _cache_engine_locked(cache_key: str, engine: Engine, SessionLocal: sessionmaker) -> None:
+    """Cache an engine, evicting the least recently used ones beyond the limit.
+
+    Evicted engines are disposed, which closes their idle pooled connections,
+    and tracked weakly so they can be revived or disposed later while anyone
+    still holds them. Must be called with _engine_cache_lock held.
+    """
+    _engine_cache[cache_key] = (engine, SessionLocal)
+    while len(_engine_cache) > MAX_CACHED_ENGINES:
+        evicted_key, (evicted_engine, _) = _engine_cache.popitem(last=False)
+        evicted_engine.dispose()
+        _evicted_engines[evicted_key] = evicted_engine
+
+
 def dispose_engine(project_dir: Path) -> bool:
     """Dispose of and remove the cached engine for a project.
 
     This closes all database connections, releasing file locks on Windows.
-    Should be called before deleting the database file.
+    Should be called before deleting the database file. Also covers an
+    engine that was evicted from the cache but is still in use.
 
     Returns:
         True if an engine was disposed, False if no engine was cached.
     """
     cache_key = project_dir.as_posix()
 
-    if cache_key in _engine_cache:
-        engine, _ = _engine_cache.pop(cache_key)
-        engine.dispose()
-        return True
+    with _engine_cache_lock:
+        cached = _engine_cache.pop(cache_key, None)
+        evicted = _evicted_engines.pop(cache_key, None)
 
-    return False
+    disposed = False
+    if cached is not None:
+        cached[0].dispose()
+        disposed = True
+    if evicted is not None:
+        evicted.dispose()
+        disposed = True
+    return disposed
 
 
 # Global session maker - will be set when server starts
@@ -486,7 +544,18 @@ _session_maker: Optional[sessionmaker] = None
 
 # Engine cache to avoid creating new engines for each request
 # Key: project directory path (as posix string), Value: (engine, SessionLocal)
-_engine_cache: dict[str, tuple] = {}
+# Ordered by recency of use; bounded by MAX_CACHED_ENGINES (LRU eviction).
+# Disposing an evicted engine only closes idle pooled connections, so callers
+# still holding its SessionLocal keep working.
+MAX_CACHED_ENGINES = 64
+_engine_cache: OrderedDict[str, tuple] = OrderedDict()
+
+# Evicted engines that may still be referenced elsewhere, by project key
+_evicted_engines: weakref.WeakValueDictionary[str, Engine] = weakref.WeakValueDictionary()
+
+# Guards _engine_cache and _evicted_engines; handlers call create_database()
+# from the threadpool
+_engine_cache_lock = threading.Lock()
 
 
 def set_session_maker(session_maker: sessionmaker) -> None:
@@ -377,11 +377,10 @@ def get_ready_features(features: list[dict], limit: int = 10) -> list[dict]:
         if all(dep_id in passing_ids for dep_id in deps):
             ready.append(f)
 
-    # Sort by scheduling score (higher = first), then priority, then id
+    # Top `limit` by scheduling score (higher = first), then priority, then id.
+    # nsmallest is equivalent to sorted()[:limit] without sorting the whole list.
     scores = compute_scheduling_scores(features)
-    ready.sort(key=lambda f: (-scores.get(f["id"], 0), f.get("priority", 999), f["id"]))
-
-    return ready[:limit]
+    return heapq.nsmallest(limit, ready, key=lambda f: (-scores.get(f["id"], 0), f.get("priority", 999), f["id"]))
 
 
 def get_blocked_features(features: list[dict]) -> list[dict]:
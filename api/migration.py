@@ -71,10 +71,9 @@ def migrate_json_to_sqlite(
     # Import features into database
     session = session_maker()
     try:
-        imported_count = 0
-        for i, feature_dict in enumerate(features_data):
+        session.add_all([
             # Handle both old format (no id/priority/name) and new format
-            feature = Feature(
+            Feature(
                 id=feature_dict.get("id", i + 1),
                 priority=feature_dict.get("priority", i + 1),
                 category=feature_dict.get("category", "uncategorized"),
@@ -85,9 +84,8 @@ def migrate_json_to_sqlite(
                 in_progress=feature_dict.get("in_progress", False),
                 dependencies=feature_dict.get("dependencies"),
             )
-            session.add(feature)
-            imported_count += 1
-
+            for i, feature_dict in enumerate(features_data)
+        ])
         session.commit()
 
         # Verify import
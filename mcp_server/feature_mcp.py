@@ -27,6 +27,7 @@ Note: Feature selection (which feature to work on) is handled by the
 orchestrator, not by agents. Agents receive pre-assigned feature IDs.
 """
 
+import heapq
 import json
 import os
 import sys
@@ -35,7 +36,7 @@ from pathlib import Path
 from typing import Annotated
 
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StrictInt, TypeAdapter, ValidationError
 from sqlalchemy import text
 
 # Add parent directory to path so we can import from api module
@@ -92,6 +93,24 @@ class BulkCreateInput(BaseModel):
     features: list[FeatureCreateItem] = Field(..., min_length=1, description="List of features to create")
 
 
+class BulkFeatureItem(BaseModel):
+    """A single feature_create_bulk entry.
+
+    Deliberately laxer than FeatureCreateItem: it only requires the four
+    fields to be present, like the tool always has, so empty steps lists,
+    long names and a null depends_on_indices are still accepted.
+    """
+    category: str
+    name: str
+    description: str
+    steps: list[str]
+    depends_on_indices: list[StrictInt] | None = None
+
+
+# Validates a whole feature_create_bulk payload in one pydantic-core call
+_feature_list_adapter = TypeAdapter(list[BulkFeatureItem])
+
+
 # Global database session maker (initialized on startup)
 _session_maker = None
 _engine = None
@@ -557,6 +576,43 @@ def feature_create_bulk(
     Returns:
         JSON with: created (int) - number of features created, with_dependencies (int)
     """
+    # Validate all features in a single pass before taking the write lock
+    try:
+        items = _feature_list_adapter.validate_python(features)
+    except ValidationError as e:
+        err = e.errors()[0]
+        loc = err["loc"]
+        field = ".".join(str(part) for part in loc[1:]) or "feature"
+        return json.dumps({
+            "error": f"Feature at index {loc[0]} has invalid '{field}': {err['msg']}"
+        })
+
+    # Validate depends_on_indices
+    for i, item in enumerate(items):
+        indices = item.depends_on_indices
+        if not indices:
+            continue
+        # Check max dependencies
+        if len(indices) > MAX_DEPENDENCIES_PER_FEATURE:
+            return json.dumps({
+                "error": f"Feature at index {i} has {len(indices)} dependencies, max is {MAX_DEPENDENCIES_PER_FEATURE}"
+            })
+        # Check for duplicates
+        if len(indices) != len(set(indices)):
+            return json.dumps({
+                "error": f"Feature at index {i} has duplicate dependencies"
+            })
+        # Check for forward references (can only depend on earlier features)
+        for idx in indices:
+            if idx < 0:
+                return json.dumps({
+                    "error": f"Feature at index {i} has invalid dependency index: {idx}"
+                })
+            if idx >= i:
+                return json.dumps({
+                    "error": f"Feature at index {i} cannot depend on feature at index {idx} (forward reference not allowed)"
+                })
+
     try:
         # Use atomic transaction for bulk inserts to prevent priority conflicts
         with atomic_transaction(_session_maker) as session:
@@ -566,47 +622,15 @@ def feature_create_bulk(
             """)).fetchone()
             start_priority = (result[0] or 0) + 1
 
-            # First pass: validate all features and their index-based dependencies
-            for i, feature_data in enumerate(features):
-                # Validate required fields
-                if not all(key in feature_data for key in ["category", "name", "description", "steps"]):
-                    return json.dumps({
-                        "error": f"Feature at index {i} missing required fields (category, name, description, steps)"
-                    })
-
-                # Validate depends_on_indices
-                indices = feature_data.get("depends_on_indices", [])
-                if indices:
-                    # Check max dependencies
-                    if len(indices) > MAX_DEPENDENCIES_PER_FEATURE:
-                        return json.dumps({
-                            "error": f"Feature at index {i} has {len(indices)} dependencies, max is {MAX_DEPENDENCIES_PER_FEATURE}"
-                        })
-                    # Check for duplicates
-                    if len(indices) != len(set(indices)):
-                        return json.dumps({
-                            "error": f"Feature at index {i} has duplicate dependencies"
-                        })
-                    # Check for forward references (can only depend on earlier features)
-                    for idx in indices:
-                        if not isinstance(idx, int) or idx < 0:
-                            return json.dumps({
-                                "error": f"Feature at index {i} has invalid dependency index: {idx}"
-                            })
-                        if idx >= i:
-                            return json.dumps({
-                                "error": f"Feature at index {i} cannot depend on feature at index {idx} (forward reference not allowed)"
-                            })
-
-            # Second pass: create all features with reserved priorities
+            # Create all features with reserved priorities
             created_features: list[Feature] = []
-            for i, feature_data in enumerate(features):
+            for i, item in enumerate(items):
                 db_feature = Feature(
                     priority=start_priority + i,
-                    category=feature_data["category"],
-                    name=feature_data["name"],
-                    description=feature_data["description"],
-                    steps=feature_data["steps"],
+                    category=item.category,
+                    name=item.name,
+                    description=item.description,
+                    steps=item.steps,
                     passes=False,
                     in_progress=False,
                 )
@@ -616,10 +640,10 @@ def feature_create_bulk(
             # Flush to get IDs assigned
             session.flush()
 
-            # Third pass: resolve index-based dependencies to actual IDs
+            # Resolve index-based dependencies to actual IDs
             deps_count = 0
-            for i, feature_data in enumerate(features):
-                indices = feature_data.get("depends_on_indices", [])
+            for i, item in enumerate(items):
+                indices = item.depends_on_indices
                 if indices:
                     # Convert indices to actual feature IDs
                     dep_ids = [created_features[idx].id for idx in indices]
@@ -821,13 +845,13 @@ def feature_get_ready(
             if all(dep_id in passing_ids for dep_id in deps):
                 ready.append(f.to_dict())
 
-        # Sort by scheduling score (higher = first), then priority, then id
+        # Top `limit` by scheduling score (higher = first), then priority, then id
         scores = compute_scheduling_scores(all_dicts)
-        ready.sort(key=lambda f: (-scores.get(f["id"], 0), f["priority"], f["id"]))
+        top = heapq.nsmallest(limit, ready, key=lambda f: (-scores.get(f["id"], 0), f["priority"], f["id"]))
 
         return json.dumps({
-            "features": ready[:limit],
-            "count": len(ready[:limit]),
+            "features": top,
+            "count": len(top),
             "total_ready": len(ready)
         })
     finally:
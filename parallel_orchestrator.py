@@ -20,13 +20,16 @@ Usage:
 
 import asyncio
 import atexit
+import heapq
 import logging
 import os
+import queue
 import re
 import signal
 import subprocess
 import sys
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Literal
@@ -48,39 +51,98 @@ DEBUG_LOG_FILE = AUTOFORGE_ROOT / "orchestrator_debug.log"
 
 
 class DebugLogger:
-    """Thread-safe debug logger that writes to a file."""
+    """Thread-safe debug logger that writes to a file.
+
+    Callers only format an entry and put it on a queue; a daemon writer
+    thread owns the file handle and does the disk I/O, so logging from the
+    orchestrator's event loop never blocks on open/write. Once close() has
+    run (at interpreter exit) entries are written synchronously instead.
+    """
 
     def __init__(self, log_file: Path = DEBUG_LOG_FILE):
         self.log_file = log_file
         self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue[tuple[str, str] | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._closed = False
         self._session_started = False
         # DON'T clear on import - only mark session start when run_loop begins
 
+    def _emit(self, mode: str, text: str) -> None:
+        """Queue text for the writer thread (mode "w" truncates the file first)."""
+        with self._lock:
+            if self._closed:
+                with open(self.log_file, mode) as f:
+                    f.write(text)
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run, name="orchestrator-debug-log", daemon=True
+                )
+                self._writer.start()
+                atexit.register(self.close)
+            # Enqueue under the lock so an entry can never land behind
+            # close()'s stop sentinel and be dropped
+            self._queue.put((mode, text))
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue into the log file."""
+        f = None
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                mode, text = item
+                try:
+                    if f is None or mode == "w":
+                        if f is not None:
+                            f.close()
+                        f = open(self.log_file, mode)
+                    f.write(text)
+                    if self._queue.empty():
+                        f.flush()
+                except OSError:
+                    pass  # Debug logging must never take down the orchestrator
+        finally:
+            if f is not None:
+                f.close()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending entries and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+            if writer is not None:
+                self._queue.put(None)
+        if writer is not None:
+            writer.join(timeout)
+
     def start_session(self):
         """Mark the start of a new orchestrator session. Clears previous logs."""
-        with self._lock:
-            self._session_started = True
-            with open(self.log_file, "w") as f:
-                f.write(f"=== Orchestrator Debug Log Started: {datetime.now().isoformat()} ===\n")
-                f.write(f"=== PID: {os.getpid()} ===\n\n")
+        self._session_started = True
+        self._emit(
+            "w",
+            f"=== Orchestrator Debug Log Started: {datetime.now().isoformat()} ===\n"
+            f"=== PID: {os.getpid()} ===\n\n",
+        )
 
     def log(self, category: str, message: str, **kwargs):
         """Write a timestamped log entry."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        with self._lock:
-            with open(self.log_file, "a") as f:
-                f.write(f"[{timestamp}] [{category}] {message}\n")
-                for key, value in kwargs.items():
-                    f.write(f"    {key}: {value}\n")
-                f.write("\n")
+        # time.strftime on a float clock avoids building a datetime per entry
+        now = time.time()
+        timestamp = f"{time.strftime('%H:%M:%S', time.localtime(now))}.{int(now % 1 * 1000):03d}"
+        parts = [f"[{timestamp}] [{category}] {message}\n"]
+        for key, value in kwargs.items():
+            parts.append(f"    {key}: {value}\n")
+        parts.append("\n")
+        self._emit("a", "".join(parts))
 
     def section(self, title: str):
         """Write a section header."""
-        with self._lock:
-            with open(self.log_file, "a") as f:
-                f.write(f"\n{'='*60}\n")
-                f.write(f"  {title}\n")
-                f.write(f"{'='*60}\n\n")
+        self._emit("a", f"\n{'='*60}\n  {title}\n{'='*60}\n\n")
 
 
 # Global debug logger instance
@@ -232,6 +294,14 @@ class ParallelOrchestrator:
         """Get a new database session."""
         return self._session_maker()
 
+    @staticmethod
+    def _load_features(session, feature_ids: list[int]) -> dict[int, Feature]:
+        """Fetch several features in one query, keyed by ID (missing IDs are absent)."""
+        if not feature_ids:
+            return {}
+        features = session.query(Feature).filter(Feature.id.in_(feature_ids)).all()
+        return {f.id: f for f in features}
+
     def _get_random_passing_feature(self) -> int | None:
         """Get a random passing feature for regression testing (no claim needed).
 
@@ -350,9 +420,9 @@ class ParallelOrchestrator:
 
             scored.append((f_id, score))
 
-        # Sort by score descending (highest priority first)
-        scored.sort(key=lambda x: x[1], reverse=True)
-        selected = [fid for fid, _ in scored[:batch_size]]
+        # Highest scores first; nlargest avoids sorting every passing feature
+        # just to take the first batch_size
+        selected = [fid for fid, _ in heapq.nlargest(batch_size, scored, key=lambda x: x[1])]
 
         # Track what we've tested to avoid re-testing the same features next batch
         self._recently_tested.update(selected)
@@ -600,8 +670,9 @@ class ParallelOrchestrator:
             session = self.get_session()
             try:
                 session.expire_all()
-                all_features = session.query(Feature).all()
-                feature_dicts = [f.to_dict() for f in all_features]
+                # Only id and passes are needed; skip hydrating full rows
+                rows = session.query(Feature.id, Feature.passes).all()
+                feature_dicts = [{"id": fid, "passes": bool(passes)} for fid, passes in rows]
             finally:
                 session.close()
 
@@ -786,9 +857,10 @@ class ParallelOrchestrator:
         # Mark all features as in_progress in a single transaction
         session = self.get_session()
         try:
+            features_by_id = self._load_features(session, feature_ids)
             features_to_mark = []
             for fid in feature_ids:
-                feature = session.query(Feature).filter(Feature.id == fid).first()
+                feature = features_by_id.get(fid)
                 if not feature:
                     return False, f"Feature {fid} not found"
                 if feature.passes:
@@ -813,9 +885,8 @@ class ParallelOrchestrator:
             # Clear in_progress on failure
             session = self.get_session()
             try:
-                for fid in feature_ids:
-                    feature = session.query(Feature).filter(Feature.id == fid).first()
-                    if feature and not resume:
+                if not resume:
+                    for feature in self._load_features(session, feature_ids).values():
                         feature.in_progress = False
                 session.commit()
             finally:
@@ -929,11 +1000,9 @@ class ParallelOrchestrator:
             # Reset in_progress on failure
             session = self.get_session()
             try:
-                for fid in feature_ids:
-                    feature = session.query(Feature).filter(Feature.id == fid).first()
-                    if feature:
-                        feature.in_progress = False
-                        session.commit()
+                for feature in self._load_features(session, feature_ids).values():
+                    feature.in_progress = False
+                session.commit()
             finally:
                 session.close()
             return False, f"Failed to start batch agent: {e}"
@@ -1290,8 +1359,10 @@ class ParallelOrchestrator:
         session = self.get_session()
         try:
             session.expire_all()
+            features_by_id = self._load_features(session, all_feature_ids)
+            cleared = []
             for fid in all_feature_ids:
-                feature = session.query(Feature).filter(Feature.id == fid).first()
+                feature = features_by_id.get(fid)
                 feature_passes = feature.passes if feature else None
                 feature_in_progress = feature.in_progress if feature else None
                 debug_log.log("DB", f"Feature #{fid} state after session.expire_all()",
@@ -1299,7 +1370,10 @@ class ParallelOrchestrator:
                     in_progress=feature_in_progress)
                 if feature and feature.in_progress and not feature.passes:
                     feature.in_progress = False
-                    session.commit()
+                    cleared.append(fid)
+            if cleared:
+                session.commit()
+                for fid in cleared:
                     debug_log.log("DB", f"Cleared in_progress for feature #{fid} (agent failed)")
         finally:
             session.close()
@@ -11,6 +11,7 @@ Fallback chain:
 
 import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 # Base templates location (generic templates)
@@ -26,6 +27,25 @@ def get_project_prompts_dir(project_dir: Path) -> Path:
     return get_prompts_dir(project_dir)
 
 
+@lru_cache(maxsize=64)
+def _read_prompt_file(path: str, mtime_ns: int, size: int) -> str:
+    """Read a prompt file; mtime_ns and size are cache keys so edits are picked up."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _read_prompt(path: Path) -> str | None:
+    """Read a prompt file, or return None if it does not exist.
+
+    Prompts are loaded for every agent session but rarely change, so the
+    content is cached and re-read only when the file's stat changes.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return _read_prompt_file(str(path), st.st_mtime_ns, st.st_size)
+
+
 def load_prompt(name: str, project_dir: Path | None = None) -> str:
     """
     Load a prompt template with fallback chain.
@@ -48,19 +68,23 @@ def load_prompt(name: str, project_dir: Path | None = None) -> str:
     if project_dir:
         project_prompts = get_project_prompts_dir(project_dir)
         project_path = project_prompts / f"{name}.md"
-        if project_path.exists():
-            try:
-                return project_path.read_text(encoding="utf-8")
-            except (OSError, PermissionError) as e:
-                print(f"Warning: Could not read {project_path}: {e}")
+        try:
+            content = _read_prompt(project_path)
+        except (OSError, PermissionError) as e:
+            print(f"Warning: Could not read {project_path}: {e}")
+            content = None
+        if content is not None:
+            return content
 
     # 2. Try base template
     template_path = TEMPLATES_DIR / f"{name}.template.md"
-    if template_path.exists():
-        try:
-            return template_path.read_text(encoding="utf-8")
-        except (OSError, PermissionError) as e:
-            print(f"Warning: Could not read {template_path}: {e}")
+    try:
+        content = _read_prompt(template_path)
+    except (OSError, PermissionError) as e:
+        print(f"Warning: Could not read {template_path}: {e}")
+        content = None
+    if content is not None:
+        return content
 
     raise FileNotFoundError(
         f"Prompt '{name}' not found in:\n"
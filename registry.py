@@ -658,6 +658,20 @@ def list_valid_projects() -> list[dict[str, Any]]:
 # Settings CRUD Functions
 # =============================================================================
 
+# Cached result of get_all_settings(), keyed on the registry file's
+# (mtime_ns, size) so writes from other processes are picked up too.
+_settings_cache: tuple[tuple[int, int], dict[str, str]] | None = None
+
+
+def _registry_signature(engine) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of the registry database file, or None."""
+    try:
+        st = os.stat(engine.url.database)
+    except (OSError, TypeError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def get_setting(key: str, default: str | None = None) -> str | None:
     """
     Get a setting value by key.
@@ -669,17 +683,7 @@ def get_setting(key: str, default: str | None = None) -> str | None:
     Returns:
         The setting value, or default if not found or on error.
     """
-    try:
-        _, SessionLocal = _get_engine()
-        session = SessionLocal()
-        try:
-            setting = session.query(Settings).filter(Settings.key == key).first()
-            return setting.value if setting else default
-        finally:
-            session.close()
-    except Exception as e:
-        logger.warning("Failed to read setting '%s': %s", key, e)
-        return default
+    return get_all_settings().get(key, default)
 
 
 # Valid Claude Code reasoning/effort levels. Must match the CLI's --effort
@@ -725,6 +729,9 @@ def set_setting(key: str, value: str) -> None:
             )
             session.add(setting)
 
+    global _settings_cache
+    _settings_cache = None
+
     logger.debug("Set setting '%s' = '%s'", key, value)
 
 
@@ -735,11 +742,21 @@ def get_all_settings() -> dict[str, str]:
     Automatically migrates legacy model IDs (e.g. claude-opus-4-6 -> claude-opus-4-7)
     on first read after upgrade. This is a one-time silent migration.
 
+    Results are cached until the registry database file changes.
+
     Returns:
         Dictionary mapping setting keys to values.
     """
+    global _settings_cache
     try:
-        _, SessionLocal = _get_engine()
+        engine, SessionLocal = _get_engine()
+        # Take the signature before querying so a concurrent write can only
+        # make the cached entry look stale, never look fresh
+        signature = _registry_signature(engine)
+        cached = _settings_cache
+        if cached is not None and signature is not None and cached[0] == signature:
+            return dict(cached[1])
+
         session = SessionLocal()
         try:
             settings = session.query(Settings).all()
@@ -761,6 +778,8 @@ def get_all_settings() -> dict[str, str]:
 
             if migrated:
                 session.commit()
+            elif signature is not None:
+                _settings_cache = (signature, dict(result))
 
             return result
         finally:
@@ -838,6 +857,14 @@ API_PROVIDERS: dict[str, dict[str, Any]] = {
 }
 
 
+# Model tier overrides that all point at the provider's selected model
+_MODEL_TIER_ENV_VARS = (
+    "ANTHROPIC_DEFAULT_OPUS_MODEL",
+    "ANTHROPIC_DEFAULT_SONNET_MODEL",
+    "ANTHROPIC_DEFAULT_HAIKU_MODEL",
+)
+
+
 def get_effective_sdk_env() -> dict[str, str]:
     """Build environment variable dict for Claude SDK based on current API provider settings.
 
@@ -850,29 +877,17 @@ def get_effective_sdk_env() -> dict[str, str]:
     all_settings = get_all_settings()
     provider_id = all_settings.get("api_provider", "claude")
 
-    if provider_id == "claude":
-        # Default behavior: forward existing env vars
-        from env_constants import API_ENV_VARS
-        sdk_env: dict[str, str] = {}
-        for var in API_ENV_VARS:
-            value = os.getenv(var)
-            if value:
-                sdk_env[var] = value
-        return sdk_env
-
     # Alternative provider: build env from settings
-    provider = API_PROVIDERS.get(provider_id)
-    if not provider:
-        logger.warning("Unknown API provider '%s', falling back to claude", provider_id)
+    provider = API_PROVIDERS.get(provider_id) if provider_id != "claude" else None
+
+    if provider is None:
+        if provider_id != "claude":
+            logger.warning("Unknown API provider '%s', falling back to claude", provider_id)
+        # Default behavior: forward existing env vars
         from env_constants import API_ENV_VARS
-        sdk_env = {}
-        for var in API_ENV_VARS:
-            value = os.getenv(var)
-            if value:
-                sdk_env[var] = value
-        return sdk_env
+        return {var: value for var in API_ENV_VARS if (value := os.getenv(var))}
 
-    sdk_env = {}
+    sdk_env: dict[str, str] = {}
 
     # Explicitly clear credentials that could leak from the server process env.
     # For providers using ANTHROPIC_AUTH_TOKEN (GLM, Custom), clear ANTHROPIC_API_KEY.
@@ -902,9 +917,7 @@ def get_effective_sdk_env() -> dict[str, str]:
     # Model - set all three tier overrides to the same model
     model = all_settings.get("api_model") or provider.get("default_model")
     if model:
-        sdk_env["ANTHROPIC_DEFAULT_OPUS_MODEL"] = model
-        sdk_env["ANTHROPIC_DEFAULT_SONNET_MODEL"] = model
-        sdk_env["ANTHROPIC_DEFAULT_HAIKU_MODEL"] = model
+        sdk_env.update(dict.fromkeys(_MODEL_TIER_ENV_VARS, model))
 
     # Timeout
     timeout = all_settings.get("api_timeout_ms")
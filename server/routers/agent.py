@@ -6,14 +6,17 @@ API endpoints for agent control (start/stop/pause/resume).
 Uses project registry for path lookups.
 """
 
-from pathlib import Path
+import asyncio
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
+
+from registry import DEFAULT_MODEL, get_all_settings
 
 from ..schemas import AgentActionResponse, AgentStartRequest, AgentStatus
 from ..services.chat_constants import ROOT_DIR
 from ..services.process_manager import get_manager
 from ..utils.project_helpers import get_project_path as _get_project_path
+from ..utils.project_helpers import resolve_project_dir
 from ..utils.validation import validate_project_name
 
 
@@ -23,13 +26,6 @@ def _get_settings_defaults() -> tuple[bool, str, int, int, int]:
     Returns:
         Tuple of (yolo_mode, model, testing_agent_ratio, batch_size, testing_batch_size)
     """
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-
-    from registry import DEFAULT_MODEL, get_all_settings
-
     settings = get_all_settings()
     yolo_mode = (settings.get("yolo_mode") or "false").lower() == "true"
     model = settings.get("api_model") or settings.get("model", DEFAULT_MODEL)
@@ -55,17 +51,20 @@ def _get_settings_defaults() -> tuple[bool, str, int, int, int]:
 
 router = APIRouter(prefix="/api/projects/{project_name}/agent", tags=["agent"])
 
+# Per-project locks serializing lifecycle operations (start/stop/pause/resume),
+# so two concurrent requests can't interleave on the same agent process
+_project_locks: dict[str, asyncio.Lock] = {}
+
+
+def _get_project_lock(project_name: str) -> asyncio.Lock:
+    """Get the lifecycle lock for a project, creating it on first use."""
+    return _project_locks.setdefault(project_name, asyncio.Lock())
+
 
 def get_project_manager(project_name: str):
     """Get the process manager for a project."""
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail=f"Project directory not found: {project_dir}")
+    project_dir = resolve_project_dir(project_name)
 
     return get_manager(project_name, project_dir, ROOT_DIR)
 
@@ -110,15 +109,16 @@ async def start_agent(
     testing_batch_size = default_testing_batch_size
 
     # Always run headless - the embedded browser view panel replaces desktop windows
-    success, message = await manager.start(
-        yolo_mode=yolo_mode,
-        model=model,
-        max_concurrency=max_concurrency,
-        testing_agent_ratio=testing_agent_ratio,
-        playwright_headless=True,
-        batch_size=batch_size,
-        testing_batch_size=testing_batch_size,
-    )
+    async with _get_project_lock(manager.project_name):
+        success, message = await manager.start(
+            yolo_mode=yolo_mode,
+            model=model,
+            max_concurrency=max_concurrency,
+            testing_agent_ratio=testing_agent_ratio,
+            playwright_headless=True,
+            batch_size=batch_size,
+            testing_batch_size=testing_batch_size,
+        )
 
     # Notify scheduler of manual start (to prevent auto-stop during scheduled window)
     if success:
@@ -139,7 +139,8 @@ async def stop_agent(project_name: str):
     """Stop the agent for a project."""
     manager = get_project_manager(project_name)
 
-    success, message = await manager.stop()
+    async with _get_project_lock(manager.project_name):
+        success, message = await manager.stop()
 
     # Notify scheduler of manual stop (to prevent auto-start during scheduled window)
     if success:
@@ -160,7 +161,8 @@ async def pause_agent(project_name: str):
     """Pause the agent for a project."""
     manager = get_project_manager(project_name)
 
-    success, message = await manager.pause()
+    async with _get_project_lock(manager.project_name):
+        success, message = await manager.pause()
 
     return AgentActionResponse(
         success=success,
@@ -174,7 +176,8 @@ async def resume_agent(project_name: str):
     """Resume a paused agent."""
     manager = get_project_manager(project_name)
 
-    success, message = await manager.resume()
+    async with _get_project_lock(manager.project_name):
+        success, message = await manager.resume()
 
     return AgentActionResponse(
         success=success,
@@ -188,7 +191,8 @@ async def graceful_pause_agent(project_name: str):
     """Request a graceful pause (drain mode) - finish current work then pause."""
     manager = get_project_manager(project_name)
 
-    success, message = await manager.graceful_pause()
+    async with _get_project_lock(manager.project_name):
+        success, message = await manager.graceful_pause()
 
     return AgentActionResponse(
         success=success,
@@ -202,7 +206,8 @@ async def graceful_resume_agent(project_name: str):
     """Resume from a graceful pause."""
     manager = get_project_manager(project_name)
 
-    success, message = await manager.graceful_resume()
+    async with _get_project_lock(manager.project_name):
+        success, message = await manager.graceful_resume()
 
     return AgentActionResponse(
         success=success,
@@ -26,6 +26,7 @@ from ..services.assistant_database import (
     get_conversations,
 )
 from ..utils.project_helpers import get_project_path as _get_project_path
+from ..utils.project_helpers import resolve_project_dir
 from ..utils.validation import validate_project_name
 
 logger = logging.getLogger(__name__)
@@ -82,12 +83,10 @@ async def list_project_conversations(project_name: str):
     if not validate_project_name(project_name):
         raise HTTPException(status_code=400, detail="Invalid project name")
 
-    project_dir = _get_project_path(project_name)
-    if not project_dir or not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project not found")
+    project_dir = resolve_project_dir(project_name)
 
     conversations = get_conversations(project_dir, project_name)
-    return [ConversationSummary(**c) for c in conversations]
+    return [ConversationSummary.model_validate(c) for c in conversations]
 
 
 @router.get("/conversations/{project_name}/{conversation_id}", response_model=ConversationDetail)
@@ -96,22 +95,14 @@ async def get_project_conversation(project_name: str, conversation_id: int):
     if not validate_project_name(project_name):
         raise HTTPException(status_code=400, detail="Invalid project name")
 
-    project_dir = _get_project_path(project_name)
-    if not project_dir or not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project not found")
+    project_dir = resolve_project_dir(project_name)
 
     conversation = get_conversation(project_dir, conversation_id)
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return ConversationDetail(
-        id=conversation["id"],
-        project_name=conversation["project_name"],
-        title=conversation["title"],
-        created_at=conversation["created_at"],
-        updated_at=conversation["updated_at"],
-        messages=[ConversationMessageModel(**m) for m in conversation["messages"]],
-    )
+    # Validates the nested message dicts in the same pass
+    return ConversationDetail.model_validate(conversation)
 
 
 @router.post("/conversations/{project_name}", response_model=ConversationSummary)
@@ -120,9 +111,7 @@ async def create_project_conversation(project_name: str):
     if not validate_project_name(project_name):
         raise HTTPException(status_code=400, detail="Invalid project name")
 
-    project_dir = _get_project_path(project_name)
-    if not project_dir or not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project not found")
+    project_dir = resolve_project_dir(project_name)
 
     conversation = create_conversation(project_dir, project_name)
     return ConversationSummary(
@@ -141,9 +130,7 @@ async def delete_project_conversation(project_name: str, conversation_id: int):
     if not validate_project_name(project_name):
         raise HTTPException(status_code=400, detail="Invalid project name")
 
-    project_dir = _get_project_path(project_name)
-    if not project_dir or not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project not found")
+    project_dir = resolve_project_dir(project_name)
 
     success = delete_conversation(project_dir, conversation_id)
     if not success:
@@ -27,7 +27,7 @@ from ..services.project_config import (
     get_project_config,
     set_dev_command,
 )
-from ..utils.project_helpers import get_project_path as _get_project_path
+from ..utils.project_helpers import resolve_project_dir
 from ..utils.validation import validate_project_name
 
 # Add root to path for security module import
@@ -57,19 +57,7 @@ def get_project_dir(project_name: str) -> Path:
         HTTPException: If project is not found or directory does not exist
     """
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Project '{project_name}' not found in registry"
-        )
-
-    if not project_dir.exists():
-        raise HTTPException(
-            status_code=404,
-            detail=f"Project directory not found: {project_dir}"
-        )
+    project_dir = resolve_project_dir(project_name)
 
     return project_dir
 
@@ -150,7 +138,7 @@ def validate_custom_command_strict(cmd: str) -> None:
         for a in argv[2:]:
             if a.startswith("-"):
                 # Handle --flag=value syntax
-                flag_key = a.split("=", 1)[0]
+                flag_key = a.partition("=")[0]
                 if flag_key not in allowed_flags:
                     raise ValueError(f"uvicorn flag not allowed: {flag_key}")
 
@@ -348,6 +336,18 @@ async def stop_devserver(project_name: str) -> DevServerActionResponse:
     )
 
 
+def _build_config_response(project_dir: Path) -> DevServerConfigResponse:
+    """Build the dev server config response for a validated project directory."""
+    config = get_project_config(project_dir)
+
+    return DevServerConfigResponse(
+        detected_type=config["detected_type"],
+        detected_command=config["detected_command"],
+        custom_command=config["custom_command"],
+        effective_command=config["effective_command"],
+    )
+
+
 @router.get("/config", response_model=DevServerConfigResponse)
 async def get_devserver_config(project_name: str) -> DevServerConfigResponse:
     """
@@ -366,14 +366,7 @@ async def get_devserver_config(project_name: str) -> DevServerConfigResponse:
         Configuration details for the project's dev server
     """
     project_dir = get_project_dir(project_name)
-    config = get_project_config(project_dir)
-
-    return DevServerConfigResponse(
-        detected_type=config["detected_type"],
-        detected_command=config["detected_command"],
-        custom_command=config["custom_command"],
-        effective_command=config["effective_command"],
-    )
+    return _build_config_response(project_dir)
 
 
 @router.patch("/config", response_model=DevServerConfigResponse)
@@ -426,11 +419,4 @@ async def update_devserver_config(
             )
 
     # Return updated config
-    config = get_project_config(project_dir)
-
-    return DevServerConfigResponse(
-        detected_type=config["detected_type"],
-        detected_command=config["detected_command"],
-        custom_command=config["custom_command"],
-        effective_command=config["effective_command"],
-    )
+    return _build_config_response(project_dir)
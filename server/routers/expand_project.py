@@ -63,7 +63,7 @@ async def get_expand_session_status(project_name: str):
         is_active=True,
         is_complete=session.is_complete(),
         features_created=session.get_features_created(),
-        message_count=len(session.get_messages()),
+        message_count=session.get_message_count(),
     )
 
 
@@ -6,12 +6,17 @@ API endpoints for feature/test case management.
 """
 
 import logging
+import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Literal
+from typing import Any, Callable, Literal
 
 from fastapi import APIRouter, HTTPException
 
+from api.database import Feature, create_database
+from api.dependency_resolver import MAX_DEPENDENCIES_PER_FEATURE, would_create_circular_dependency
+from autoforge_paths import get_features_db_path
+
 from ..schemas import (
     DependencyGraphEdge,
     DependencyGraphNode,
@@ -25,32 +30,56 @@ from ..schemas import (
     FeatureUpdate,
     HumanInputResponse,
 )
-from ..utils.project_helpers import get_project_path as _get_project_path
+from ..utils.project_helpers import resolve_project_dir as _resolve_project_dir
 from ..utils.validation import validate_project_name
 
-# Lazy imports to avoid circular dependencies
-_create_database = None
-_Feature = None
-
 logger = logging.getLogger(__name__)
 
 
-def _get_db_classes():
-    """Lazy import of database classes."""
-    global _create_database, _Feature
-    if _create_database is None:
-        import sys
-        from pathlib import Path
-        root = Path(__file__).parent.parent.parent
-        if str(root) not in sys.path:
-            sys.path.insert(0, str(root))
-        from api.database import Feature, create_database
-        _create_database = create_database
-        _Feature = Feature
-    return _create_database, _Feature
+router = APIRouter(prefix="/api/projects/{project_name}/features", tags=["features"])
+
+# The UI polls the feature list and dependency graph every few seconds,
+# often from several tabs. Serve repeat reads from memory until features.db
+# (or its WAL) changes on disk, which also catches writes made by the agent's
+# MCP server process. The WAL file is reused after a checkpoint, so a write
+# landing in the same mtime tick as a poll can leave the signature unchanged;
+# entries also expire after this long so such a miss can't persist.
+READ_CACHE_TTL_SECONDS = 1.0
 
+_read_cache: dict[tuple[str, str], tuple[tuple, float, Any]] = {}
 
-router = APIRouter(prefix="/api/projects/{project_name}/features", tags=["features"])
+
+def _features_db_signature(project_dir: Path) -> tuple:
+    """(mtime_ns, size) of features.db and its -wal file (None if missing)."""
+    db_file = get_features_db_path(project_dir)
+    signature = []
+    for path in (db_file, db_file.with_name(db_file.name + "-wal")):
+        try:
+            st = path.stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _cached(project_name: str, kind: str, compute: Callable[[], Any]) -> Any:
+    """Return a cached read for a project, recomputing when the DB changed."""
+    key = (project_name, kind)
+    now = time.monotonic()
+    signature = _features_db_signature(_resolve_project_dir(project_name))
+    hit = _read_cache.get(key)
+    if hit is not None and hit[0] == signature and now - hit[1] < READ_CACHE_TTL_SECONDS:
+        return hit[2]
+    value = compute()
+    _read_cache[key] = (signature, now, value)
+    return value
+
+
+def _invalidate_cache(project_name: str) -> None:
+    """Drop cached reads for a project after its features change."""
+    for kind in ("list", "graph"):
+        _read_cache.pop((project_name, kind), None)
 
 
 @contextmanager
@@ -59,7 +88,6 @@ def get_db_session(project_dir: Path):
     Context manager for database sessions.
     Ensures session is always closed, even on exceptions.
     """
-    create_database, _ = _get_db_classes()
     _, SessionLocal = create_database(project_dir)
     session = SessionLocal()
     try:
@@ -122,21 +150,17 @@ async def list_features(project_name: str):
     - done: passes=True
     """
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
+    return _cached(project_name, "list", lambda: _list_features(project_name))
 
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
 
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+def _list_features(project_name: str) -> FeatureListResponse:
+    """Query the project's features and group them by status."""
+    project_dir = _resolve_project_dir(project_name)
 
-    from autoforge_paths import get_features_db_path
     db_file = get_features_db_path(project_dir)
     if not db_file.exists():
         return FeatureListResponse(pending=[], in_progress=[], done=[])
 
-    _, Feature = _get_db_classes()
-
     try:
         with get_db_session(project_dir) as session:
             all_features = session.query(Feature).order_by(Feature.priority).all()
@@ -177,15 +201,8 @@ async def list_features(project_name: str):
 async def create_feature(project_name: str, feature: FeatureCreate):
     """Create a new feature/test case manually."""
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    _, Feature = _get_db_classes()
+    _invalidate_cache(project_name)
+    project_dir = _resolve_project_dir(project_name)
 
     try:
         with get_db_session(project_dir) as session:
@@ -243,13 +260,8 @@ async def create_features_bulk(project_name: str, bulk: FeatureBulkCreate):
         {"created": N, "features": [...]}
     """
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    _invalidate_cache(project_name)
+    project_dir = _resolve_project_dir(project_name)
 
     if not bulk.features:
         return FeatureBulkCreateResponse(created=0, features=[])
@@ -258,8 +270,6 @@ async def create_features_bulk(project_name: str, bulk: FeatureBulkCreate):
     if bulk.starting_priority is not None and bulk.starting_priority < 1:
         raise HTTPException(status_code=400, detail="starting_priority must be >= 1")
 
-    _, Feature = _get_db_classes()
-
     try:
         with get_db_session(project_dir) as session:
             # Determine starting priority
@@ -322,21 +332,17 @@ async def get_dependency_graph(project_name: str):
     rendering with React Flow or similar graph libraries.
     """
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
+    return _cached(project_name, "graph", lambda: _build_dependency_graph(project_name))
 
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
 
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+def _build_dependency_graph(project_name: str) -> DependencyGraphResponse:
+    """Query the project's features and build graph nodes and edges."""
+    project_dir = _resolve_project_dir(project_name)
 
-    from autoforge_paths import get_features_db_path
     db_file = get_features_db_path(project_dir)
     if not db_file.exists():
         return DependencyGraphResponse(nodes=[], edges=[])
 
-    _, Feature = _get_db_classes()
-
     try:
         with get_db_session(project_dir) as session:
             all_features = session.query(Feature).all()
@@ -390,21 +396,12 @@ async def get_dependency_graph(project_name: str):
 async def get_feature(project_name: str, feature_id: int):
     """Get details of a specific feature."""
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
+    project_dir = _resolve_project_dir(project_name)
 
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    from autoforge_paths import get_features_db_path
     db_file = get_features_db_path(project_dir)
     if not db_file.exists():
         raise HTTPException(status_code=404, detail="No features database found")
 
-    _, Feature = _get_db_classes()
-
     try:
         with get_db_session(project_dir) as session:
             feature = session.query(Feature).filter(Feature.id == feature_id).first()
@@ -430,15 +427,8 @@ async def update_feature(project_name: str, feature_id: int, update: FeatureUpda
     when the agent is stuck or implementing a feature incorrectly.
     """
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    _, Feature = _get_db_classes()
+    _invalidate_cache(project_name)
+    project_dir = _resolve_project_dir(project_name)
 
     try:
         with get_db_session(project_dir) as session:
@@ -492,15 +482,8 @@ async def delete_feature(project_name: str, feature_id: int):
     dependencies that would permanently block features.
     """
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    _, Feature = _get_db_classes()
+    _invalidate_cache(project_name)
+    project_dir = _resolve_project_dir(project_name)
 
     try:
         with get_db_session(project_dir) as session:
@@ -543,15 +526,8 @@ async def skip_feature(project_name: str, feature_id: int):
     so it will be processed last.
     """
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    _, Feature = _get_db_classes()
+    _invalidate_cache(project_name)
+    project_dir = _resolve_project_dir(project_name)
 
     try:
         with get_db_session(project_dir) as session:
@@ -582,15 +558,8 @@ async def resolve_human_input(project_name: str, feature_id: int, response: Huma
     and returns the feature to the pending queue for agents to pick up.
     """
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    _, Feature = _get_db_classes()
+    _invalidate_cache(project_name)
+    project_dir = _resolve_project_dir(project_name)
 
     try:
         with get_db_session(project_dir) as session:
@@ -644,16 +613,6 @@ async def resolve_human_input(project_name: str, feature_id: int, response: Huma
 # ============================================================================
 
 
-def _get_dependency_resolver():
-    """Lazy import of dependency resolver."""
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-    from api.dependency_resolver import MAX_DEPENDENCIES_PER_FEATURE, would_create_circular_dependency
-    return would_create_circular_dependency, MAX_DEPENDENCIES_PER_FEATURE
-
-
 @router.post("/{feature_id}/dependencies/{dep_id}")
 async def add_dependency(project_name: str, feature_id: int, dep_id: int):
     """Add a dependency relationship between features.
@@ -662,21 +621,13 @@ async def add_dependency(project_name: str, feature_id: int, dep_id: int):
     Validates: self-reference, existence, circular dependencies, max limit.
     """
     project_name = validate_project_name(project_name)
+    _invalidate_cache(project_name)
 
     # Security: Self-reference check
     if feature_id == dep_id:
         raise HTTPException(status_code=400, detail="A feature cannot depend on itself")
 
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    would_create_circular_dependency, MAX_DEPENDENCIES_PER_FEATURE = _get_dependency_resolver()
-    _, Feature = _get_db_classes()
+    project_dir = _resolve_project_dir(project_name)
 
     try:
         with get_db_session(project_dir) as session:
@@ -719,15 +670,8 @@ async def add_dependency(project_name: str, feature_id: int, dep_id: int):
 async def remove_dependency(project_name: str, feature_id: int, dep_id: int):
     """Remove a dependency from a feature."""
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
-
-    _, Feature = _get_db_classes()
+    _invalidate_cache(project_name)
+    project_dir = _resolve_project_dir(project_name)
 
     try:
         with get_db_session(project_dir) as session:
@@ -758,13 +702,8 @@ async def set_dependencies(project_name: str, feature_id: int, update: Dependenc
     Validates: self-reference, existence of all dependencies, circular dependencies, max limit.
     """
     project_name = validate_project_name(project_name)
-    project_dir = _get_project_path(project_name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    _invalidate_cache(project_name)
+    project_dir = _resolve_project_dir(project_name)
 
     dependency_ids = update.dependency_ids
 
@@ -776,9 +715,6 @@ async def set_dependencies(project_name: str, feature_id: int, update: Dependenc
     if len(dependency_ids) != len(set(dependency_ids)):
         raise HTTPException(status_code=400, detail="Duplicate dependencies not allowed")
 
-    would_create_circular_dependency, _ = _get_dependency_resolver()
-    _, Feature = _get_db_classes()
-
     try:
         with get_db_session(project_dir) as session:
             feature = session.query(Feature).filter(Feature.id == feature_id).first()
@@ -94,6 +94,10 @@ HIDDEN_PATTERNS = [
     r".*secrets.*",      # Secrets files
 ]
 
+# Compiled once into a single alternation: matches_blocked_pattern() runs for
+# every directory entry, so this avoids one re-cache lookup per pattern per entry.
+_HIDDEN_PATTERNS_RE = re.compile("|".join(f"(?:{p})" for p in HIDDEN_PATTERNS), re.IGNORECASE)
+
 
 @functools.lru_cache(maxsize=1)
 def get_blocked_paths() -> frozenset[Path]:
@@ -171,10 +175,7 @@ def is_hidden_file(path: Path) -> bool:
 
 def matches_blocked_pattern(name: str) -> bool:
     """Check if filename matches a blocked pattern."""
-    for pattern in HIDDEN_PATTERNS:
-        if re.match(pattern, name, re.IGNORECASE):
-            return True
-    return False
+    return _HIDDEN_PATTERNS_RE.match(name) is not None
 
 
 def is_unc_path(path_str: str) -> bool:
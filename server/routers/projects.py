@@ -6,7 +6,7 @@ API endpoints for project management.
 Uses project registry for path lookups instead of fixed generations/ directory.
 """
 
-import re
+import asyncio
 import shutil
 import sys
 from pathlib import Path
@@ -14,6 +14,18 @@ from typing import Any, Callable
 
 from fastapi import APIRouter, HTTPException
 
+from registry import (
+    get_project_auto_improve,
+    get_project_concurrency,
+    get_project_path,
+    list_registered_projects,
+    register_project,
+    set_project_auto_improve,
+    set_project_concurrency,
+    unregister_project,
+    validate_project_path,
+)
+
 from ..schemas import (
     ProjectCreate,
     ProjectDetail,
@@ -23,6 +35,8 @@ from ..schemas import (
     ProjectStats,
     ProjectSummary,
 )
+from ..utils.project_helpers import clear_project_dir_cache, resolve_project_dir
+from ..utils.validation import validate_project_name
 
 # Lazy imports to avoid circular dependencies
 # These are initialized by _init_imports() before first use.
@@ -58,50 +72,9 @@ def _init_imports():
     _imports_initialized = True
 
 
-def _get_registry_functions():
-    """Get registry functions with lazy import."""
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-
-    from registry import (
-        get_project_auto_improve,
-        get_project_concurrency,
-        get_project_path,
-        list_registered_projects,
-        register_project,
-        set_project_auto_improve,
-        set_project_concurrency,
-        unregister_project,
-        validate_project_path,
-    )
-    return (
-        register_project,
-        unregister_project,
-        get_project_path,
-        list_registered_projects,
-        validate_project_path,
-        get_project_concurrency,
-        set_project_concurrency,
-        get_project_auto_improve,
-        set_project_auto_improve,
-    )
-
-
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
 
-def validate_project_name(name: str) -> str:
-    """Validate and sanitize project name to prevent path traversal."""
-    if not re.match(r'^[a-zA-Z0-9_-]{1,50}$', name):
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid project name. Use only letters, numbers, hyphens, and underscores (1-50 chars)."
-        )
-    return name
-
-
 def get_project_stats(project_dir: Path) -> ProjectStats:
     """Get statistics for a project."""
     _init_imports()
@@ -116,41 +89,50 @@ def get_project_stats(project_dir: Path) -> ProjectStats:
     )
 
 
+def _build_project_summary(name: str, info: dict[str, Any]) -> ProjectSummary | None:
+    """Build a project's summary, or None if its path no longer exists."""
+    assert _check_spec_exists is not None  # guaranteed by _init_imports()
+
+    project_dir = Path(info["path"])
+
+    # Skip if path no longer exists
+    is_valid, _ = validate_project_path(project_dir)
+    if not is_valid:
+        return None
+
+    has_spec = _check_spec_exists(project_dir)
+    stats = get_project_stats(project_dir)
+
+    return ProjectSummary(
+        name=name,
+        path=info["path"],
+        has_spec=has_spec,
+        stats=stats,
+        default_concurrency=info.get("default_concurrency", 3),
+        auto_improve_enabled=bool(info.get("auto_improve_enabled", False)),
+        auto_improve_interval_minutes=int(
+            info.get("auto_improve_interval_minutes", 10) or 10
+        ),
+    )
+
+
 @router.get("", response_model=list[ProjectSummary])
 async def list_projects():
     """List all registered projects."""
     _init_imports()
-    assert _check_spec_exists is not None  # guaranteed by _init_imports()
-    (_, _, _, list_registered_projects, validate_project_path,
-     get_project_concurrency, _, _, _) = _get_registry_functions()
 
     projects = list_registered_projects()
-    result = []
-
-    for name, info in projects.items():
-        project_dir = Path(info["path"])
 
-        # Skip if path no longer exists
-        is_valid, _ = validate_project_path(project_dir)
-        if not is_valid:
-            continue
+    # Each summary stats the project directory and opens its features
+    # database; build them concurrently in the executor instead of one
+    # after another on the event loop.
+    loop = asyncio.get_running_loop()
+    summaries = await asyncio.gather(*(
+        loop.run_in_executor(None, _build_project_summary, name, info)
+        for name, info in projects.items()
+    ))
 
-        has_spec = _check_spec_exists(project_dir)
-        stats = get_project_stats(project_dir)
-
-        result.append(ProjectSummary(
-            name=name,
-            path=info["path"],
-            has_spec=has_spec,
-            stats=stats,
-            default_concurrency=info.get("default_concurrency", 3),
-            auto_improve_enabled=bool(info.get("auto_improve_enabled", False)),
-            auto_improve_interval_minutes=int(
-                info.get("auto_improve_interval_minutes", 10) or 10
-            ),
-        ))
-
-    return result
+    return [summary for summary in summaries if summary is not None]
 
 
 @router.post("", response_model=ProjectSummary)
@@ -158,8 +140,6 @@ async def create_project(project: ProjectCreate):
     """Create a new project at the specified path."""
     _init_imports()
     assert _scaffold_project_prompts is not None  # guaranteed by _init_imports()
-    (register_project, _, get_project_path, list_registered_projects,
-     _, _, _, _, _) = _get_registry_functions()
 
     name = validate_project_name(project.name)
     project_path = Path(project.path).resolve()
@@ -224,6 +204,7 @@ async def create_project(project: ProjectCreate):
             status_code=500,
             detail=f"Failed to register project: {e}"
         )
+    clear_project_dir_cache()
 
     return ProjectSummary(
         name=name,
@@ -234,23 +215,10 @@ async def create_project(project: ProjectCreate):
     )
 
 
-@router.get("/{name}", response_model=ProjectDetail)
-async def get_project(name: str):
-    """Get detailed information about a project."""
-    _init_imports()
+def _build_project_detail(name: str, project_dir: Path) -> ProjectDetail:
+    """Build a project's detail response from an already-validated directory."""
     assert _check_spec_exists is not None  # guaranteed by _init_imports()
     assert _get_project_prompts_dir is not None  # guaranteed by _init_imports()
-    (_, _, get_project_path, _, _, get_project_concurrency, _,
-     get_project_auto_improve, _) = _get_registry_functions()
-
-    name = validate_project_name(name)
-    project_dir = get_project_path(name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail=f"Project directory no longer exists: {project_dir}")
 
     has_spec = _check_spec_exists(project_dir)
     stats = get_project_stats(project_dir)
@@ -269,6 +237,16 @@ async def get_project(name: str):
     )
 
 
+@router.get("/{name}", response_model=ProjectDetail)
+async def get_project(name: str):
+    """Get detailed information about a project."""
+    _init_imports()
+    name = validate_project_name(name)
+    project_dir = resolve_project_dir(name)
+
+    return _build_project_detail(name, project_dir)
+
+
 @router.delete("/{name}")
 async def delete_project(name: str, delete_files: bool = False):
     """
@@ -279,7 +257,6 @@ async def delete_project(name: str, delete_files: bool = False):
         delete_files: If True, also delete the project directory and files
     """
     _init_imports()
-    (_, unregister_project, get_project_path, _, _, _, _, _, _) = _get_registry_functions()
 
     name = validate_project_name(name)
     project_dir = get_project_path(name)
@@ -304,6 +281,7 @@ async def delete_project(name: str, delete_files: bool = False):
 
     # Unregister from registry
     unregister_project(name)
+    clear_project_dir_cache()
 
     return {
         "success": True,
@@ -316,16 +294,8 @@ async def get_project_prompts(name: str):
     """Get the content of project prompt files."""
     _init_imports()
     assert _get_project_prompts_dir is not None  # guaranteed by _init_imports()
-    (_, _, get_project_path, _, _, _, _, _, _) = _get_registry_functions()
-
     name = validate_project_name(name)
-    project_dir = get_project_path(name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    project_dir = resolve_project_dir(name)
 
     prompts_dir: Path = _get_project_prompts_dir(project_dir)
 
@@ -350,16 +320,8 @@ async def update_project_prompts(name: str, prompts: ProjectPromptsUpdate):
     """Update project prompt files."""
     _init_imports()
     assert _get_project_prompts_dir is not None  # guaranteed by _init_imports()
-    (_, _, get_project_path, _, _, _, _, _, _) = _get_registry_functions()
-
     name = validate_project_name(name)
-    project_dir = get_project_path(name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    project_dir = resolve_project_dir(name)
 
     prompts_dir = _get_project_prompts_dir(project_dir)
     prompts_dir.mkdir(parents=True, exist_ok=True)
@@ -380,16 +342,8 @@ async def update_project_prompts(name: str, prompts: ProjectPromptsUpdate):
 async def get_project_stats_endpoint(name: str):
     """Get current progress statistics for a project."""
     _init_imports()
-    (_, _, get_project_path, _, _, _, _, _, _) = _get_registry_functions()
-
     name = validate_project_name(name)
-    project_dir = get_project_path(name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    project_dir = resolve_project_dir(name)
 
     return get_project_stats(project_dir)
 
@@ -407,16 +361,8 @@ async def reset_project(name: str, full_reset: bool = False):
         Dictionary with list of deleted files and reset type
     """
     _init_imports()
-    (_, _, get_project_path, _, _, _, _, _, _) = _get_registry_functions()
-
     name = validate_project_name(name)
-    project_dir = get_project_path(name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    project_dir = resolve_project_dir(name)
 
     # Check if agent is running
     from autoforge_paths import has_agent_running
@@ -501,20 +447,9 @@ async def reset_project(name: str, full_reset: bool = False):
 async def update_project_settings(name: str, settings: ProjectSettingsUpdate):
     """Update project-level settings (concurrency, auto-improve, etc.)."""
     _init_imports()
-    assert _check_spec_exists is not None  # guaranteed by _init_imports()
-    assert _get_project_prompts_dir is not None  # guaranteed by _init_imports()
-    (_, _, get_project_path, _, _, get_project_concurrency,
-     set_project_concurrency, get_project_auto_improve,
-     set_project_auto_improve) = _get_registry_functions()
 
     name = validate_project_name(name)
-    project_dir = get_project_path(name)
-
-    if not project_dir:
-        raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    project_dir = resolve_project_dir(name)
 
     # Update concurrency if provided
     if settings.default_concurrency is not None:
@@ -555,18 +490,4 @@ async def update_project_settings(name: str, settings: ProjectSettingsUpdate):
             scheduler.remove_auto_improve(name)
 
     # Return updated project details
-    has_spec = _check_spec_exists(project_dir)
-    stats = get_project_stats(project_dir)
-    prompts_dir = _get_project_prompts_dir(project_dir)
-    ai_enabled, ai_interval = get_project_auto_improve(name)
-
-    return ProjectDetail(
-        name=name,
-        path=project_dir.as_posix(),
-        has_spec=has_spec,
-        stats=stats,
-        prompts_dir=str(prompts_dir),
-        default_concurrency=get_project_concurrency(name),
-        auto_improve_enabled=ai_enabled,
-        auto_improve_interval_minutes=ai_interval,
-    )
+    return _build_project_detail(name, project_dir)
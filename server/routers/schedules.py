@@ -6,16 +6,16 @@ API endpoints for managing agent schedules.
 Provides CRUD operations for time-based schedule configuration.
 """
 
+import logging
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Generator, Tuple
+from typing import Generator, Tuple
 
 from fastapi import APIRouter, HTTPException
 from sqlalchemy.orm import Session
 
-# Schedule limits to prevent resource exhaustion
-MAX_SCHEDULES_PER_PROJECT = 50
+from api.database import Schedule, ScheduleOverride, create_database
 
 from ..schemas import (
     NextRunResponse,
@@ -24,14 +24,17 @@ from ..schemas import (
     ScheduleResponse,
     ScheduleUpdate,
 )
-from ..utils.project_helpers import get_project_path as _get_project_path
+from ..services.scheduler_service import get_scheduler
+from ..utils.project_helpers import resolve_project_dir
 from ..utils.validation import validate_project_name
 
-if TYPE_CHECKING:
-    from api.database import Schedule as ScheduleModel
+# Schedule limits to prevent resource exhaustion
+MAX_SCHEDULES_PER_PROJECT = 50
+
+logger = logging.getLogger(__name__)
 
 
-def _schedule_to_response(schedule: "ScheduleModel") -> ScheduleResponse:
+def _schedule_to_response(schedule: Schedule) -> ScheduleResponse:
     """Convert a Schedule ORM object to a ScheduleResponse Pydantic model.
 
     SQLAlchemy Column descriptors resolve to Python types at instance access time,
@@ -55,22 +58,8 @@ def _get_db_session(project_name: str) -> Generator[Tuple[Session, Path], None,
             # ... use db ...
         # db is automatically closed
     """
-    from api.database import create_database
-
     project_name = validate_project_name(project_name)
-    project_path = _get_project_path(project_name)
-
-    if not project_path:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Project '{project_name}' not found in registry"
-        )
-
-    if not project_path.exists():
-        raise HTTPException(
-            status_code=404,
-            detail=f"Project directory not found: {project_path}"
-        )
+    project_path = resolve_project_dir(project_name)
 
     _, SessionLocal = create_database(project_path)
     db = SessionLocal()
@@ -86,8 +75,6 @@ def _get_db_session(project_name: str) -> Generator[Tuple[Session, Path], None,
 @router.get("", response_model=ScheduleListResponse)
 async def list_schedules(project_name: str):
     """Get all schedules for a project."""
-    from api.database import Schedule
-
     with _get_db_session(project_name) as (db, _):
         schedules = db.query(Schedule).filter(
             Schedule.project_name == project_name
@@ -101,10 +88,6 @@ async def list_schedules(project_name: str):
 @router.post("", response_model=ScheduleResponse, status_code=201)
 async def create_schedule(project_name: str, data: ScheduleCreate):
     """Create a new schedule for a project."""
-    from api.database import Schedule
-
-    from ..services.scheduler_service import get_scheduler
-
     with _get_db_session(project_name) as (db, project_path):
         # Check schedule limit to prevent resource exhaustion
         existing_count = db.query(Schedule).filter(
@@ -133,9 +116,6 @@ async def create_schedule(project_name: str, data: ScheduleCreate):
 
         # Register with APScheduler if enabled
         if schedule.enabled:
-            import logging
-            logger = logging.getLogger(__name__)
-
             scheduler = get_scheduler()
             await scheduler.add_schedule(project_name, schedule, project_path)
             logger.info(f"Registered schedule {schedule.id} with APScheduler")
@@ -148,7 +128,6 @@ async def create_schedule(project_name: str, data: ScheduleCreate):
 
             if is_within:
                 # Check for manual stop override
-                from api.database import ScheduleOverride
                 override = db.query(ScheduleOverride).filter(
                     ScheduleOverride.schedule_id == schedule.id,
                     ScheduleOverride.override_type == "stop",
@@ -174,10 +153,6 @@ async def create_schedule(project_name: str, data: ScheduleCreate):
 @router.get("/next", response_model=NextRunResponse)
 async def get_next_scheduled_run(project_name: str):
     """Calculate next scheduled run across all enabled schedules."""
-    from api.database import Schedule, ScheduleOverride
-
-    from ..services.scheduler_service import get_scheduler
-
     with _get_db_session(project_name) as (db, _):
         schedules = db.query(Schedule).filter(
             Schedule.project_name == project_name,
@@ -236,8 +211,6 @@ async def get_next_scheduled_run(project_name: str):
 @router.get("/{schedule_id}", response_model=ScheduleResponse)
 async def get_schedule(project_name: str, schedule_id: int):
     """Get a single schedule by ID."""
-    from api.database import Schedule
-
     with _get_db_session(project_name) as (db, _):
         schedule = db.query(Schedule).filter(
             Schedule.id == schedule_id,
@@ -257,10 +230,6 @@ async def update_schedule(
     data: ScheduleUpdate
 ):
     """Update an existing schedule."""
-    from api.database import Schedule
-
-    from ..services.scheduler_service import get_scheduler
-
     with _get_db_session(project_name) as (db, project_path):
         schedule = db.query(Schedule).filter(
             Schedule.id == schedule_id,
@@ -296,10 +265,6 @@ async def update_schedule(
 @router.delete("/{schedule_id}", status_code=204)
 async def delete_schedule(project_name: str, schedule_id: int):
     """Delete a schedule."""
-    from api.database import Schedule
-
-    from ..services.scheduler_service import get_scheduler
-
     with _get_db_session(project_name) as (db, _):
         schedule = db.query(Schedule).filter(
             Schedule.id == schedule_id,
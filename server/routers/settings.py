@@ -33,6 +33,27 @@ from registry import (
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
+# Model and provider definitions are static registry data, so build their
+# response objects once at import instead of on every request
+_CLAUDE_MODELS = [ModelInfo(id=m["id"], name=m["name"]) for m in AVAILABLE_MODELS]
+
+_PROVIDER_MODELS: dict[str, list[ModelInfo]] = {
+    pid: [ModelInfo(id=m["id"], name=m["name"]) for m in pdata.get("models", [])]
+    for pid, pdata in API_PROVIDERS.items()
+}
+
+_PROVIDERS = [
+    ProviderInfo(
+        id=pid,
+        name=pdata["name"],
+        base_url=pdata.get("base_url"),
+        models=_PROVIDER_MODELS[pid],
+        default_model=pdata.get("default_model", ""),
+        requires_auth=pdata.get("requires_auth", False),
+    )
+    for pid, pdata in API_PROVIDERS.items()
+]
+
 
 def _parse_yolo_mode(value: str | None) -> bool:
     """Parse YOLO mode string to boolean."""
@@ -40,24 +61,14 @@ def _parse_yolo_mode(value: str | None) -> bool:
 
 
 @router.get("/providers", response_model=ProvidersResponse)
-async def get_available_providers():
+def get_available_providers():
     """Get list of available API providers."""
     current = get_setting("api_provider", "claude") or "claude"
-    providers = []
-    for pid, pdata in API_PROVIDERS.items():
-        providers.append(ProviderInfo(
-            id=pid,
-            name=pdata["name"],
-            base_url=pdata.get("base_url"),
-            models=[ModelInfo(id=m["id"], name=m["name"]) for m in pdata.get("models", [])],
-            default_model=pdata.get("default_model", ""),
-            requires_auth=pdata.get("requires_auth", False),
-        ))
-    return ProvidersResponse(providers=providers, current=current)
+    return ProvidersResponse(providers=_PROVIDERS, current=current)
 
 
 @router.get("/models", response_model=ModelsResponse)
-async def get_available_models():
+def get_available_models():
     """Get list of available models.
 
     Returns models for the currently selected API provider.
@@ -66,15 +77,14 @@ async def get_available_models():
     provider = API_PROVIDERS.get(current_provider)
 
     if provider and current_provider != "claude":
-        provider_models = provider.get("models", [])
         return ModelsResponse(
-            models=[ModelInfo(id=m["id"], name=m["name"]) for m in provider_models],
+            models=_PROVIDER_MODELS[current_provider],
             default=provider.get("default_model", ""),
         )
 
     # Default: return Claude models
     return ModelsResponse(
-        models=[ModelInfo(id=m["id"], name=m["name"]) for m in AVAILABLE_MODELS],
+        models=_CLAUDE_MODELS,
         default=DEFAULT_MODEL,
     )
 
@@ -96,11 +106,8 @@ def _parse_bool(value: str | None, default: bool = False) -> bool:
     return value.lower() == "true"
 
 
-
-
-@router.get("", response_model=SettingsResponse)
-async def get_settings():
-    """Get current global settings."""
+def _build_settings_response() -> SettingsResponse:
+    """Build the settings response from the current registry values."""
     all_settings = get_all_settings()
 
     api_provider = all_settings.get("api_provider", "claude")
@@ -125,8 +132,14 @@ async def get_settings():
     )
 
 
+@router.get("", response_model=SettingsResponse)
+def get_settings():
+    """Get current global settings."""
+    return _build_settings_response()
+
+
 @router.patch("", response_model=SettingsResponse)
-async def update_settings(update: SettingsUpdate):
+def update_settings(update: SettingsUpdate):
     """Update global settings."""
     if update.yolo_mode is not None:
         set_setting("yolo_mode", "true" if update.yolo_mode else "false")
@@ -174,24 +187,4 @@ async def update_settings(update: SettingsUpdate):
     if update.api_model is not None:
         set_setting("api_model", update.api_model)
 
-    # Return updated settings
-    all_settings = get_all_settings()
-    api_provider = all_settings.get("api_provider", "claude")
-    glm_mode = api_provider == "glm"
-    ollama_mode = api_provider == "ollama"
-
-    return SettingsResponse(
-        yolo_mode=_parse_yolo_mode(all_settings.get("yolo_mode")),
-        model=all_settings.get("model", DEFAULT_MODEL),
-        glm_mode=glm_mode,
-        ollama_mode=ollama_mode,
-        testing_agent_ratio=_parse_int(all_settings.get("testing_agent_ratio"), 1),
-        playwright_headless=True,  # Always headless - embedded browser view replaces desktop windows
-        batch_size=_parse_int(all_settings.get("batch_size"), 3),
-        testing_batch_size=_parse_int(all_settings.get("testing_batch_size"), 3),
-        effort=get_effort_setting(),
-        api_provider=api_provider,
-        api_base_url=all_settings.get("api_base_url"),
-        api_has_auth_token=bool(all_settings.get("api_auth_token")),
-        api_model=all_settings.get("api_model"),
-    )
+    return _build_settings_response()
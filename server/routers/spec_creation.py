@@ -21,6 +21,7 @@ from ..services.spec_chat_session import (
     remove_session,
 )
 from ..utils.project_helpers import get_project_path as _get_project_path
+from ..utils.project_helpers import resolve_project_dir
 from ..utils.validation import is_valid_project_name, validate_project_name
 
 logger = logging.getLogger(__name__)
@@ -60,7 +61,7 @@ async def get_session_status(project_name: str):
         project_name=project_name,
         is_active=True,
         is_complete=session.is_complete(),
-        message_count=len(session.get_messages()),
+        message_count=session.get_message_count(),
     )
 
 
@@ -98,12 +99,7 @@ async def get_spec_file_status(project_name: str):
     if not is_valid_project_name(project_name):
         raise HTTPException(status_code=400, detail="Invalid project name")
 
-    project_dir = _get_project_path(project_name)
-    if not project_dir:
-        raise HTTPException(status_code=404, detail="Project not found in registry")
-
-    if not project_dir.exists():
-        raise HTTPException(status_code=404, detail="Project directory not found")
+    project_dir = resolve_project_dir(project_name)
 
     from autoforge_paths import get_prompts_dir
     status_file = get_prompts_dir(project_dir) / ".spec_status.json"
@@ -32,6 +32,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/terminal", tags=["terminal"])
 
+# Compiled once; checked on every terminal request and WebSocket connect
+_TERMINAL_ID_RE = re.compile(r"^[a-zA-Z0-9]{1,16}$")
+
 
 class TerminalCloseCode:
     """WebSocket close codes for terminal endpoint."""
@@ -51,7 +54,7 @@ def validate_terminal_id(terminal_id: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    return bool(re.match(r"^[a-zA-Z0-9]{1,16}$", terminal_id))
+    return bool(_TERMINAL_ID_RE.match(terminal_id))
 
 
 # Pydantic models for request/response bodies
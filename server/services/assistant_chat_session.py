@@ -10,28 +10,31 @@ but cannot modify any files.
 import json
 import logging
 import os
-import shutil
 import sys
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import AsyncGenerator, Optional
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 
-from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 from dotenv import load_dotenv
 
 from .assistant_database import (
     add_message,
-    create_conversation,
+    create_conversation_with_initial_message,
     get_messages,
 )
 from .chat_constants import (
     ROOT_DIR,
     check_rate_limit_error,
+    close_sessions,
+    find_claude_cli,
     format_client_init_error,
     safe_receive_response,
 )
 
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeSDKClient
+
 # Load environment variables from .env file if present
 load_dotenv()
 
@@ -87,13 +90,68 @@ DISALLOWED_ASSISTANT_TOOLS = [
     "mcp__features__feature_clear_in_progress",
 ]
 
+# Tools pre-approved for the assistant's SDK client
+ASSISTANT_ALLOWED_TOOLS = [*READONLY_BUILTIN_TOOLS, *ASSISTANT_FEATURE_TOOLS]
+
+# Permissions for assistant access (read + feature management)
+ASSISTANT_PERMISSIONS = [
+    "Read(./**)",
+    "Glob(./**)",
+    "Grep(./**)",
+    "WebFetch",
+    "WebSearch",
+    *ASSISTANT_FEATURE_TOOLS,
+]
+
+# Security settings file content; identical for every project, so it is
+# serialized once here rather than on each session start
+ASSISTANT_SETTINGS_JSON = json.dumps(
+    {
+        "sandbox": {"enabled": False},  # No bash, so sandbox not needed
+        "permissions": {
+            "defaultMode": "bypassPermissions",  # Read-only, no dangerous ops
+            "allow": ASSISTANT_PERMISSIONS,
+            "deny": ["Write", "Edit", "MultiEdit", "NotebookEdit", "Bash"],
+        },
+    },
+    indent=2,
+)
+
+# Built system prompts per (project_name, project_dir), stamped with the
+# app_spec.txt (mtime_ns, size) they were built from so edits are picked up
+_system_prompt_cache: dict[tuple[str, str], tuple[tuple[int, int], str]] = {}
+_system_prompt_cache_lock = threading.Lock()
+
 
 def get_system_prompt(project_name: str, project_dir: Path) -> str:
+    """Get the system prompt for the assistant with project context.
+
+    The prompt is rebuilt only when the project's app_spec.txt changes.
+    """
+    from autoforge_paths import get_prompts_dir
+    app_spec_path = get_prompts_dir(project_dir) / "app_spec.txt"
+    try:
+        st = app_spec_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = (0, 0)
+
+    key = (project_name, str(project_dir))
+    with _system_prompt_cache_lock:
+        cached = _system_prompt_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    prompt = _build_system_prompt(project_name, app_spec_path)
+    with _system_prompt_cache_lock:
+        _system_prompt_cache[key] = (stamp, prompt)
+    return prompt
+
+
+def _build_system_prompt(project_name: str, app_spec_path: Path) -> str:
     """Generate the system prompt for the assistant with project context."""
     # Try to load app_spec.txt for context
     app_spec_content = ""
-    from autoforge_paths import get_prompts_dir
-    app_spec_path = get_prompts_dir(project_dir) / "app_spec.txt"
     if app_spec_path.exists():
         try:
             app_spec_content = app_spec_path.read_text(encoding="utf-8")
@@ -231,36 +289,31 @@ class AssistantChatSession:
         # Track if this is a new conversation (for greeting decision)
         is_new_conversation = self.conversation_id is None
 
-        # Create a new conversation if we don't have one
+        # Create a new conversation if we don't have one, storing the
+        # greeting in the same transaction
+        greeting = f"Hello! I'm your project assistant for **{self.project_name}**. I can help you understand the codebase, explain features, and answer questions about the project. What would you like to know?"
         if is_new_conversation:
-            conv = create_conversation(self.project_dir, self.project_name)
+            conv = create_conversation_with_initial_message(
+                self.project_dir, self.project_name, "assistant", greeting
+            )
             self.conversation_id = int(conv.id)  # type coercion: Column[int] -> int
             yield {"type": "conversation_created", "conversation_id": self.conversation_id}
 
-        # Build permissions list for assistant access (read + feature management)
-        permissions_list = [
-            "Read(./**)",
-            "Glob(./**)",
-            "Grep(./**)",
-            "WebFetch",
-            "WebSearch",
-            *ASSISTANT_FEATURE_TOOLS,
-        ]
-
         # Create security settings file
-        security_settings = {
-            "sandbox": {"enabled": False},  # No bash, so sandbox not needed
-            "permissions": {
-                "defaultMode": "bypassPermissions",  # Read-only, no dangerous ops
-                "allow": permissions_list,
-                "deny": ["Write", "Edit", "MultiEdit", "NotebookEdit", "Bash"],
-            },
-        }
         from autoforge_paths import get_claude_assistant_settings_path
         settings_file = get_claude_assistant_settings_path(self.project_dir)
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(settings_file, "w") as f:
-            json.dump(security_settings, f, indent=2)
+        # Skip the write only when the file on disk already has this exact
+        # content, so a policy edited on disk is always restored
+        try:
+            current_settings = settings_file.read_text()
+        except OSError:
+            current_settings = None
+        if current_settings != ASSISTANT_SETTINGS_JSON:
+            settings_file.parent.mkdir(parents=True, exist_ok=True)
+            settings_file.write_text(ASSISTANT_SETTINGS_JSON)
+
+        # Resolve once; used for the MCP server env and the client cwd
+        project_path = str(self.project_dir.resolve())
 
         # Build MCP servers config - only features MCP for read-only access
         mcp_servers = {
@@ -270,7 +323,7 @@ class AssistantChatSession:
                 "env": {
                     # Only specify variables the MCP server needs
                     # (subprocess inherits parent environment automatically)
-                    "PROJECT_DIR": str(self.project_dir.resolve()),
+                    "PROJECT_DIR": project_path,
                     "PYTHONPATH": str(ROOT_DIR.resolve()),
                 },
             },
@@ -287,7 +340,7 @@ class AssistantChatSession:
         logger.info(f"Wrote assistant system prompt to {claude_md_path}")
 
         # Use system Claude CLI
-        system_cli = shutil.which("claude")
+        system_cli = find_claude_cli()
 
         # Build environment overrides for API configuration
         from registry import DEFAULT_MODEL, get_effective_sdk_env, get_effort_setting
@@ -297,6 +350,10 @@ class AssistantChatSession:
         # Determine model from SDK env (provider-aware) or fallback to env/default
         model = sdk_env.get("ANTHROPIC_DEFAULT_OPUS_MODEL") or os.getenv("ANTHROPIC_DEFAULT_OPUS_MODEL", DEFAULT_MODEL)
 
+        # Imported here rather than at module level: the SDK is slow to import
+        # and only needed once a chat session actually starts
+        from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
         try:
             logger.info("Creating ClaudeSDKClient...")
             self.client = ClaudeSDKClient(
@@ -307,12 +364,12 @@ class AssistantChatSession:
                     # System prompt loaded from CLAUDE.md via setting_sources
                     # This avoids Windows command line length limit (~8191 chars)
                     setting_sources=["project"],
-                    allowed_tools=[*READONLY_BUILTIN_TOOLS, *ASSISTANT_FEATURE_TOOLS],
+                    allowed_tools=ASSISTANT_ALLOWED_TOOLS,
                     disallowed_tools=DISALLOWED_ASSISTANT_TOOLS,
                     mcp_servers=mcp_servers,  # type: ignore[arg-type]  # SDK accepts dict config at runtime
                     permission_mode="bypassPermissions",
                     max_turns=100,
-                    cwd=str(self.project_dir.resolve()),
+                    cwd=project_path,
                     settings=str(settings_file.resolve()),
                     env=sdk_env,
                 )
@@ -331,19 +388,9 @@ class AssistantChatSession:
         if is_new_conversation:
             # New conversations don't need history loading
             self._history_loaded = True
-            try:
-                greeting = f"Hello! I'm your project assistant for **{self.project_name}**. I can help you understand the codebase, explain features, and answer questions about the project. What would you like to know?"
-
-                # Store the greeting in the database
-                # conversation_id is guaranteed non-None here (set on line 206 above)
-                assert self.conversation_id is not None
-                add_message(self.project_dir, self.conversation_id, "assistant", greeting)
-
-                yield {"type": "text", "content": greeting}
-                yield {"type": "response_done"}
-            except Exception as e:
-                logger.exception("Failed to send greeting")
-                yield {"type": "error", "content": f"Failed to start conversation: {str(e)}"}
+            # The greeting was already stored when the conversation was created
+            yield {"type": "text", "content": greeting}
+            yield {"type": "response_done"}
         else:
             # For resumed conversations, history will be loaded on first message
             # _history_loaded stays False so send_message() will include history
@@ -415,29 +462,28 @@ class AssistantChatSession:
         if not self.client:
             return
 
+        from claude_agent_sdk import AssistantMessage, TextBlock, ToolUseBlock
+
         # Send message to Claude
         await self.client.query(message)
 
-        full_response = ""
+        # Collect text blocks and join once at the end rather than
+        # re-copying the growing response on every block
+        response_parts: list[str] = []
 
         # Stream the response
         try:
             async for msg in safe_receive_response(self.client, logger):
-                msg_type = type(msg).__name__
-
-                if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+                if isinstance(msg, AssistantMessage):
                     for block in msg.content:
-                        block_type = type(block).__name__
-
-                        if block_type == "TextBlock" and hasattr(block, "text"):
-                            text = block.text
-                            if text:
-                                full_response += text
+                        if isinstance(block, TextBlock):
+                            if text := block.text:
+                                response_parts.append(text)
                                 yield {"type": "text", "content": text}
 
-                        elif block_type == "ToolUseBlock" and hasattr(block, "name"):
+                        elif isinstance(block, ToolUseBlock):
                             tool_name = block.name
-                            tool_input = getattr(block, "input", {})
+                            tool_input = block.input
 
                             # Intercept ask_user tool calls -> yield as question message
                             if tool_name == "mcp__features__ask_user":
@@ -463,23 +509,23 @@ class AssistantChatSession:
             raise
 
         # Store the complete response in the database
-        if full_response and self.conversation_id:
-            add_message(self.project_dir, self.conversation_id, "assistant", full_response)
+        if response_parts and self.conversation_id:
+            add_message(self.project_dir, self.conversation_id, "assistant", "".join(response_parts))
 
     def get_conversation_id(self) -> Optional[int]:
         """Get the current conversation ID."""
         return self.conversation_id
 
 
-# Session registry with thread safety
+# Session registry with thread safety. Mutations (pop + insert) hold the
+# lock; single dict reads are atomic under the GIL and skip it.
 _sessions: dict[str, AssistantChatSession] = {}
 _sessions_lock = threading.Lock()
 
 
 def get_session(project_name: str) -> Optional[AssistantChatSession]:
     """Get an existing session for a project."""
-    with _sessions_lock:
-        return _sessions.get(project_name)
+    return _sessions.get(project_name)
 
 
 async def create_session(
@@ -527,8 +573,7 @@ async def remove_session(project_name: str) -> None:
 
 def list_sessions() -> list[str]:
     """List all active session project names."""
-    with _sessions_lock:
-        return list(_sessions.keys())
+    return list(_sessions)
 
 
 async def cleanup_all_sessions() -> None:
@@ -539,8 +584,4 @@ async def cleanup_all_sessions() -> None:
         sessions_to_close = list(_sessions.values())
         _sessions.clear()
 
-    for session in sessions_to_close:
-        try:
-            await session.close()
-        except Exception as e:
-            logger.warning(f"Error closing session {session.project_name}: {e}")
+    await close_sessions(sessions_to_close)
@@ -152,6 +152,33 @@ def create_conversation(project_dir: Path, project_name: str, title: Optional[st
         session.close()
 
 
+def create_conversation_with_initial_message(
+    project_dir: Path, project_name: str, role: str, content: str
+) -> Conversation:
+    """Create a new conversation and its first message in one transaction.
+
+    Saves a commit versus create_conversation() followed by add_message(),
+    e.g. when a new assistant conversation is opened with a greeting.
+    """
+    session = get_session(project_dir)
+    try:
+        conversation = Conversation(project_name=project_name)
+        session.add(conversation)
+        session.flush()  # Assigns conversation.id for the message row
+
+        session.add(ConversationMessage(
+            conversation_id=conversation.id,
+            role=role,
+            content=content,
+        ))
+        session.commit()
+        session.refresh(conversation)
+        logger.info(f"Created conversation {conversation.id} for project {project_name}")
+        return conversation
+    finally:
+        session.close()
+
+
 def get_conversations(project_dir: Path, project_name: str) -> list[dict]:
     """Get all conversations for a project with message counts.
 
@@ -41,7 +41,7 @@ class SessionInfo:
     stopped: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScreenshotData:
     """A captured screenshot ready for delivery."""
     session_name: str
@@ -273,8 +273,14 @@ _services_lock = threading.Lock()
 
 def get_browser_view_service(project_name: str, project_dir: Path) -> BrowserViewService:
     """Get or create a BrowserViewService for a project (thread-safe)."""
+    key = (project_name, str(project_dir.resolve()))
+
+    # Lock-free fast path: a dict read is atomic under the GIL
+    existing = _services.get(key)
+    if existing is not None:
+        return existing
+
     with _services_lock:
-        key = (project_name, str(project_dir.resolve()))
         if key not in _services:
             _services[key] = BrowserViewService(project_name, project_dir)
         return _services[key]
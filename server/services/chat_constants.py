@@ -9,8 +9,12 @@ project root and is re-exported here for convenience so that existing
 imports (``from .chat_constants import API_ENV_VARS``) continue to work.
 """
 
+import asyncio
 import logging
+import shutil
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, AsyncGenerator
 
@@ -44,6 +48,29 @@ from ..utils.document_extraction import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single session close during shutdown, so one hung
+# Claude CLI subprocess cannot block the rest of the cleanup.
+SESSION_CLOSE_TIMEOUT_SECONDS = 10
+
+# How long a resolved Claude CLI path is reused before PATH is searched
+# again (so a freshly installed CLI is still picked up).
+CLI_PATH_CACHE_SECONDS = 60
+
+
+@lru_cache(maxsize=8)
+def _which(name: str, bucket: int) -> str | None:
+    """``shutil.which`` cached per time bucket."""
+    return shutil.which(name)
+
+
+def find_claude_cli() -> str | None:
+    """Return the path of the system ``claude`` CLI, or ``None``.
+
+    Every chat session start needs this, so the PATH scan is cached for
+    up to ``CLI_PATH_CACHE_SECONDS``.
+    """
+    return _which("claude", int(time.monotonic() // CLI_PATH_CACHE_SECONDS))
+
 
 def check_rate_limit_error(exc: Exception) -> tuple[bool, int | None]:
     """Inspect an exception and determine if it represents a rate-limit.
@@ -124,6 +151,23 @@ async def safe_receive_response(client: Any, log: logging.Logger) -> AsyncGenera
             raise
 
 
+async def close_sessions(sessions: list[Any], kind: str = "session") -> None:
+    """Close chat sessions concurrently, bounding each ``close()`` with a timeout.
+
+    Used by the ``cleanup_all_*`` shutdown hooks so total shutdown time is
+    that of the slowest session rather than the sum of all of them.
+    """
+    results = await asyncio.gather(
+        *(asyncio.wait_for(s.close(), timeout=SESSION_CLOSE_TIMEOUT_SECONDS) for s in sessions),
+        return_exceptions=True,
+    )
+    for session, result in zip(sessions, results):
+        if isinstance(result, TimeoutError):
+            logger.warning(f"Timed out closing {kind} {session.project_name}")
+        elif isinstance(result, BaseException):
+            logger.warning(f"Error closing {kind} {session.project_name}: {result}")
+
+
 def build_attachment_content_blocks(attachments: list[FileAttachment]) -> list[dict]:
     """Convert FileAttachment objects to Claude API content blocks.
 
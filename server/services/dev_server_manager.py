@@ -472,9 +472,15 @@ def get_devserver_manager(project_name: str, project_dir: Path) -> DevServerProc
     Returns:
         DevServerProcessManager instance for the project
     """
+    # Use composite key to prevent cross-project UI contamination (#71)
+    key = (project_name, str(project_dir.resolve()))
+
+    # Lock-free fast path: a dict read is atomic under the GIL
+    existing = _managers.get(key)
+    if existing is not None:
+        return existing
+
     with _managers_lock:
-        # Use composite key to prevent cross-project UI contamination (#71)
-        key = (project_name, str(project_dir.resolve()))
         if key not in _managers:
             _managers[key] = DevServerProcessManager(project_name, project_dir)
         return _managers[key]
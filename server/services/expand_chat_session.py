@@ -10,15 +10,13 @@ import asyncio
 import json
 import logging
 import os
-import shutil
 import sys
 import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional
 
-from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 from dotenv import load_dotenv
 
 from ..schemas import FileAttachment
@@ -27,11 +25,16 @@ from .chat_constants import (
     ROOT_DIR,
     build_attachment_content_blocks,
     check_rate_limit_error,
+    close_sessions,
+    find_claude_cli,
     format_client_init_error,
     make_multimodal_message,
     safe_receive_response,
 )
 
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeSDKClient
+
 # Load environment variables from .env file if present
 load_dotenv()
 
@@ -126,7 +129,7 @@ class ExpandChatSession:
             skill_content = skill_path.read_text(encoding="utf-8", errors="replace")
 
         # Find and validate Claude CLI before creating temp files
-        system_cli = shutil.which("claude")
+        system_cli = find_claude_cli()
         if not system_cli:
             yield {
                 "type": "error",
@@ -176,12 +179,16 @@ class ExpandChatSession:
                 "command": sys.executable,
                 "args": ["-m", "mcp_server.feature_mcp"],
                 "env": {
-                    "PROJECT_DIR": str(self.project_dir.resolve()),
+                    "PROJECT_DIR": project_path,
                     "PYTHONPATH": str(ROOT_DIR.resolve()),
                 },
             },
         }
 
+        # Imported here rather than at module level: the SDK is slow to import
+        # and only needed once a chat session actually starts
+        from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
         # Create Claude SDK client
         try:
             self.client = ClaudeSDKClient(
@@ -202,7 +209,7 @@ class ExpandChatSession:
                     mcp_servers=mcp_servers,  # type: ignore[arg-type]  # SDK accepts dict config at runtime
                     permission_mode="bypassPermissions",
                     max_turns=100,
-                    cwd=str(self.project_dir.resolve()),
+                    cwd=project_path,
                     settings=str(settings_file.resolve()),
                     env=sdk_env,
                 )
@@ -348,16 +355,20 @@ class ExpandChatSession:
         """Get all messages in the conversation."""
         return self.messages.copy()
 
+    def get_message_count(self) -> int:
+        """Get the number of messages without copying the conversation."""
+        return len(self.messages)
 
-# Session registry with thread safety
+
+# Session registry with thread safety. Mutations (pop + insert) hold the
+# lock; single dict reads are atomic under the GIL and skip it.
 _expand_sessions: dict[str, ExpandChatSession] = {}
 _expand_sessions_lock = threading.Lock()
 
 
 def get_expand_session(project_name: str) -> Optional[ExpandChatSession]:
     """Get an existing expansion session for a project."""
-    with _expand_sessions_lock:
-        return _expand_sessions.get(project_name)
+    return _expand_sessions.get(project_name)
 
 
 async def create_expand_session(project_name: str, project_dir: Path) -> ExpandChatSession:
@@ -394,8 +405,7 @@ async def remove_expand_session(project_name: str) -> None:
 
 def list_expand_sessions() -> list[str]:
     """List all active expansion session project names."""
-    with _expand_sessions_lock:
-        return list(_expand_sessions.keys())
+    return list(_expand_sessions.keys())
 
 
 async def cleanup_all_expand_sessions() -> None:
@@ -406,8 +416,4 @@ async def cleanup_all_expand_sessions() -> None:
         sessions_to_close = list(_expand_sessions.values())
         _expand_sessions.clear()
 
-    for session in sessions_to_close:
-        try:
-            await session.close()
-        except Exception as e:
-            logger.warning(f"Error closing expand session {session.project_name}: {e}")
+    await close_sessions(sessions_to_close, "expand session")
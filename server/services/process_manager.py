@@ -13,6 +13,7 @@ import re
 import subprocess
 import sys
 import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Literal, Set
@@ -44,6 +45,10 @@ SENSITIVE_PATTERNS = [
 ]
 
 
+# Number of recent output lines kept for post-exit auth error detection
+OUTPUT_BUFFER_LINES = 20
+
+
 def sanitize_output(line: str) -> str:
     """Remove sensitive information from output lines."""
     for pattern in SENSITIVE_PATTERNS:
@@ -51,6 +56,16 @@ def sanitize_output(line: str) -> str:
     return line
 
 
+def _parse_lock_content(lock_content: str) -> tuple[int, float | None]:
+    """Parse agent lock file content into (pid, create_time).
+
+    Supports both the legacy format (just PID) and the current format
+    (PID:CREATE_TIME). Raises ValueError on malformed content.
+    """
+    pid_str, sep, create_time_str = lock_content.partition(":")
+    return int(pid_str), float(create_time_str) if sep else None
+
+
 class AgentProcessManager:
     """
     Manages agent subprocess lifecycle for a single project.
@@ -87,6 +102,11 @@ class AgentProcessManager:
         self.testing_agent_ratio: int = 1  # Regression testing agents (0-3)
         self.auto_improve: bool = False  # Auto-improve mode (single session)
 
+        # Serializes start(): it awaits cleanup between its status/lock checks
+        # and spawning the subprocess, so overlapping starts (e.g. scheduler +
+        # manual) must not both get past the checks
+        self._start_lock = asyncio.Lock()
+
         # Support multiple callbacks (for multiple WebSocket clients)
         self._output_callbacks: Set[Callable[[str], Awaitable[None]]] = set()
         self._status_callbacks: Set[Callable[[str], Awaitable[None]]] = set()
@@ -162,15 +182,7 @@ class AgentProcessManager:
 
         try:
             lock_content = self.lock_file.read_text().strip()
-            # Support both legacy format (just PID) and new format (PID:CREATE_TIME)
-            if ":" in lock_content:
-                pid_str, create_time_str = lock_content.split(":", 1)
-                pid = int(pid_str)
-                stored_create_time = float(create_time_str)
-            else:
-                # Legacy format - just PID
-                pid = int(lock_content)
-                stored_create_time = None
+            pid, stored_create_time = _parse_lock_content(lock_content)
 
             if psutil.pid_exists(pid):
                 # Check if it's actually our agent process
@@ -250,6 +262,16 @@ class AgentProcessManager:
         except Exception:
             logger.warning("Failed to update playwright config", exc_info=True)
 
+    def _kill_browser_daemons(self) -> None:
+        """Kill playwright-cli browser daemons (blocking, up to 5s)."""
+        try:
+            subprocess.run(
+                ["playwright-cli", "kill-all"],
+                timeout=5, capture_output=True,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+            pass
+
     def _cleanup_stale_features(self) -> None:
         """Clear in_progress flag for all features when agent stops/crashes.
 
@@ -304,7 +326,9 @@ class AgentProcessManager:
             return
 
         auth_error_detected = False
-        output_buffer = []  # Buffer recent lines for auth error detection
+        # Buffer recent lines for auth error detection. A bounded deque drops
+        # the oldest line in O(1) instead of list.pop(0)'s O(n) shift.
+        output_buffer: deque[str] = deque(maxlen=OUTPUT_BUFFER_LINES)
 
         try:
             loop = asyncio.get_running_loop()
@@ -321,8 +345,6 @@ class AgentProcessManager:
 
                 # Buffer recent output for auth error detection
                 output_buffer.append(decoded)
-                if len(output_buffer) > 20:
-                    output_buffer.pop(0)
 
                 # Check for auth errors
                 if not auth_error_detected and is_auth_error(decoded):
@@ -396,125 +418,123 @@ class AgentProcessManager:
         Returns:
             Tuple of (success, message)
         """
-        if self.status in ("running", "paused", "pausing", "paused_graceful"):
-            return False, f"Agent is already {self.status}"
+        async with self._start_lock:
+            if self.status in ("running", "paused", "pausing", "paused_graceful"):
+                return False, f"Agent is already {self.status}"
 
-        if not self._check_lock():
-            return False, "Another agent instance is already running for this project"
+            if not self._check_lock():
+                return False, "Another agent instance is already running for this project"
 
-        # Clean up stale browser daemons from previous runs
-        try:
-            subprocess.run(
-                ["playwright-cli", "kill-all"],
-                timeout=5, capture_output=True,
+            # Clean up stale browser daemons and features stuck from a previous
+            # crash/stop. Both block (subprocess + SQLite) and are independent, so
+            # run them side by side off the event loop.
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                loop.run_in_executor(None, self._kill_browser_daemons),
+                loop.run_in_executor(None, self._cleanup_stale_features),
             )
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            pass
-
-        # Clean up features stuck from a previous crash/stop
-        self._cleanup_stale_features()
-
-        # Auto-improve mode forces single-agent execution and skips testing
-        # agents — the subprocess bypasses the orchestrator entirely.
-        if auto_improve:
-            max_concurrency = 1
-            testing_agent_ratio = 0
-
-        # Store for status queries
-        self.yolo_mode = yolo_mode
-        self.model = model
-        self.parallel_mode = True  # Always True now (unified orchestrator)
-        self.max_concurrency = max_concurrency or 1
-        self.testing_agent_ratio = testing_agent_ratio
-        self.auto_improve = auto_improve
 
-        # Build command - unified orchestrator with --concurrency
-        cmd = [
-            sys.executable,
-            "-u",  # Force unbuffered stdout/stderr for real-time output
-            str(self.root_dir / "autonomous_agent_demo.py"),
-            "--project-dir",
-            str(self.project_dir.resolve()),
-        ]
+            # Auto-improve mode forces single-agent execution and skips testing
+            # agents — the subprocess bypasses the orchestrator entirely.
+            if auto_improve:
+                max_concurrency = 1
+                testing_agent_ratio = 0
+
+            # Store for status queries
+            self.yolo_mode = yolo_mode
+            self.model = model
+            self.parallel_mode = True  # Always True now (unified orchestrator)
+            self.max_concurrency = max_concurrency or 1
+            self.testing_agent_ratio = testing_agent_ratio
+            self.auto_improve = auto_improve
+
+            # Build command - unified orchestrator with --concurrency
+            cmd = [
+                sys.executable,
+                "-u",  # Force unbuffered stdout/stderr for real-time output
+                str(self.root_dir / "autonomous_agent_demo.py"),
+                "--project-dir",
+                str(self.project_dir.resolve()),
+            ]
 
-        # Add --model flag if model is specified
-        if model:
-            cmd.extend(["--model", model])
+            # Add --model flag if model is specified
+            if model:
+                cmd.extend(["--model", model])
 
-        # Add --yolo flag if YOLO mode is enabled
-        if yolo_mode:
-            cmd.append("--yolo")
+            # Add --yolo flag if YOLO mode is enabled
+            if yolo_mode:
+                cmd.append("--yolo")
 
-        # Add --auto-improve flag: bypasses the orchestrator for a one-shot run
-        if auto_improve:
-            cmd.append("--auto-improve")
+            # Add --auto-improve flag: bypasses the orchestrator for a one-shot run
+            if auto_improve:
+                cmd.append("--auto-improve")
 
-        # Add --concurrency flag (unified orchestrator always uses this)
-        cmd.extend(["--concurrency", str(max_concurrency or 1)])
+            # Add --concurrency flag (unified orchestrator always uses this)
+            cmd.extend(["--concurrency", str(max_concurrency or 1)])
 
-        # Add testing agent configuration
-        cmd.extend(["--testing-ratio", str(testing_agent_ratio)])
+            # Add testing agent configuration
+            cmd.extend(["--testing-ratio", str(testing_agent_ratio)])
 
-        # Add --batch-size flag for multi-feature batching
-        cmd.extend(["--batch-size", str(batch_size)])
+            # Add --batch-size flag for multi-feature batching
+            cmd.extend(["--batch-size", str(batch_size)])
 
-        # Add --testing-batch-size flag for testing agent batching
-        cmd.extend(["--testing-batch-size", str(testing_batch_size)])
+            # Add --testing-batch-size flag for testing agent batching
+            cmd.extend(["--testing-batch-size", str(testing_batch_size)])
 
-        # Apply headless setting to .playwright/cli.config.json so playwright-cli
-        # picks it up (the only mechanism it supports for headless control)
-        self._apply_playwright_headless(playwright_headless)
+            # Apply headless setting to .playwright/cli.config.json so playwright-cli
+            # picks it up (the only mechanism it supports for headless control)
+            self._apply_playwright_headless(playwright_headless)
 
-        try:
-            # Start subprocess with piped stdout/stderr
-            # Use project_dir as cwd so Claude SDK sandbox allows access to project files
-            # stdin=DEVNULL prevents blocking if Claude CLI or child process tries to read stdin
-            # CREATE_NO_WINDOW on Windows prevents console window pop-ups
-            # PYTHONUNBUFFERED ensures output isn't delayed
-            # Build subprocess environment with API provider settings
-            from registry import get_effective_sdk_env
-            api_env = get_effective_sdk_env()
-            subprocess_env = {
-                **os.environ,
-                "PYTHONUNBUFFERED": "1",
-                "PLAYWRIGHT_CLI_SESSION": f"agent-{self.project_name}-{os.getpid()}",
-                "NODE_COMPILE_CACHE": "",  # Disable V8 compile caching to prevent .node file accumulation in %TEMP%
-                **api_env,
-            }
-
-            popen_kwargs: dict[str, Any] = {
-                "stdin": subprocess.DEVNULL,
-                "stdout": subprocess.PIPE,
-                "stderr": subprocess.STDOUT,
-                "cwd": str(self.project_dir),
-                "env": subprocess_env,
-            }
-            if sys.platform == "win32":
-                popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-
-            self.process = subprocess.Popen(cmd, **popen_kwargs)
-
-            # Atomic lock creation - if it fails, another process beat us
-            if not self._create_lock():
-                # Kill the process we just started since we couldn't get the lock
-                self.process.terminate()
-                try:
-                    self.process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self.process.kill()
-                self.process = None
-                return False, "Another agent instance is already running for this project"
+            try:
+                # Start subprocess with piped stdout/stderr
+                # Use project_dir as cwd so Claude SDK sandbox allows access to project files
+                # stdin=DEVNULL prevents blocking if Claude CLI or child process tries to read stdin
+                # CREATE_NO_WINDOW on Windows prevents console window pop-ups
+                # PYTHONUNBUFFERED ensures output isn't delayed
+                # Build subprocess environment with API provider settings
+                from registry import get_effective_sdk_env
+                api_env = get_effective_sdk_env()
+                subprocess_env = {
+                    **os.environ,
+                    "PYTHONUNBUFFERED": "1",
+                    "PLAYWRIGHT_CLI_SESSION": f"agent-{self.project_name}-{os.getpid()}",
+                    "NODE_COMPILE_CACHE": "",  # Disable V8 compile caching to prevent .node file accumulation in %TEMP%
+                    **api_env,
+                }
+
+                popen_kwargs: dict[str, Any] = {
+                    "stdin": subprocess.DEVNULL,
+                    "stdout": subprocess.PIPE,
+                    "stderr": subprocess.STDOUT,
+                    "cwd": str(self.project_dir),
+                    "env": subprocess_env,
+                }
+                if sys.platform == "win32":
+                    popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+
+                self.process = subprocess.Popen(cmd, **popen_kwargs)
+
+                # Atomic lock creation - if it fails, another process beat us
+                if not self._create_lock():
+                    # Kill the process we just started since we couldn't get the lock
+                    self.process.terminate()
+                    try:
+                        self.process.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        self.process.kill()
+                    self.process = None
+                    return False, "Another agent instance is already running for this project"
 
-            self.started_at = datetime.now()
-            self.status = "running"
+                self.started_at = datetime.now()
+                self.status = "running"
 
-            # Start output streaming task
-            self._output_task = asyncio.create_task(self._stream_output())
+                # Start output streaming task
+                self._output_task = asyncio.create_task(self._stream_output())
 
-            return True, f"Agent started with PID {self.process.pid}"
-        except Exception as e:
-            logger.exception("Failed to start agent")
-            return False, f"Failed to start agent: {e}"
+                return True, f"Agent started with PID {self.process.pid}"
+            except Exception as e:
+                logger.exception("Failed to start agent")
+                return False, f"Failed to start agent: {e}"
 
     async def stop(self) -> tuple[bool, str]:
         """
@@ -538,18 +558,12 @@ class AgentProcessManager:
                     pass
 
             # Kill browser daemons before stopping agent
-            try:
-                subprocess.run(
-                    ["playwright-cli", "kill-all"],
-                    timeout=5, capture_output=True,
-                )
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                pass
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._kill_browser_daemons)
 
             # CRITICAL: Kill entire process tree, not just orchestrator
             # This ensures all spawned coding/testing agents are also terminated
             proc = self.process  # Capture reference before async call
-            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(None, kill_process_tree, proc, 10.0)
             logger.debug(
                 "Process tree kill result: status=%s, children=%d (terminated=%d, killed=%d)",
@@ -724,9 +738,15 @@ def get_manager(project_name: str, project_dir: Path, root_dir: Path) -> AgentPr
         project_dir: Absolute path to the project directory
         root_dir: Root directory of the autonomous-coding-ui project
     """
+    # Use composite key to prevent cross-project UI contamination (#71)
+    key = (project_name, str(project_dir.resolve()))
+
+    # Lock-free fast path: a dict read is atomic under the GIL
+    existing = _managers.get(key)
+    if existing is not None:
+        return existing
+
     with _managers_lock:
-        # Use composite key to prevent cross-project UI contamination (#71)
-        key = (project_name, str(project_dir.resolve()))
         if key not in _managers:
             _managers[key] = AgentProcessManager(project_name, project_dir, root_dir)
         return _managers[key]
@@ -795,15 +815,7 @@ def cleanup_orphaned_locks() -> int:
 
             try:
                 lock_content = lock_file.read_text().strip()
-                # Support both legacy format (just PID) and new format (PID:CREATE_TIME)
-                if ":" in lock_content:
-                    pid_str, create_time_str = lock_content.split(":", 1)
-                    pid = int(pid_str)
-                    stored_create_time = float(create_time_str)
-                else:
-                    # Legacy format - just PID
-                    pid = int(lock_content)
-                    stored_create_time = None
+                pid, stored_create_time = _parse_lock_content(lock_content)
 
                 # Check if process is still running
                 if psutil.pid_exists(pid):
@@ -106,10 +106,18 @@ def _get_config_path(project_dir: Path) -> Path:
     return new_path
 
 
+# Parsed configs keyed by config path, stamped with the file's (mtime_ns, size)
+# so edits made outside the server are still picked up
+_config_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
 def _load_config(project_dir: Path) -> dict:
     """
     Load the project configuration from disk.
 
+    Parsed files are cached until their mtime or size changes; callers get
+    a shallow copy they are free to modify.
+
     Args:
         project_dir: Path to the project directory.
 
@@ -118,9 +126,16 @@ def _load_config(project_dir: Path) -> dict:
     """
     config_path = _get_config_path(project_dir)
 
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         return {}
 
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(str(config_path))
+    if cached is not None and cached[0] == stamp:
+        return dict(cached[1])
+
     try:
         with open(config_path, "r", encoding="utf-8") as f:
             config = json.load(f)
@@ -132,7 +147,8 @@ def _load_config(project_dir: Path) -> dict:
             )
             return {}
 
-        return config
+        _config_cache[str(config_path)] = (stamp, config)
+        return dict(config)
 
     except json.JSONDecodeError as e:
         logger.warning("Failed to parse config at %s: %s", config_path, e)
@@ -164,6 +180,8 @@ def _save_config(project_dir: Path, config: dict) -> None:
         with open(config_path, "w", encoding="utf-8") as f:
             json.dump(config, f, indent=2)
         logger.debug("Saved config to %s", config_path)
+        # Drop the cached copy; a rewrite can land within the same mtime tick
+        _config_cache.pop(str(config_path), None)
     except OSError as e:
         logger.error("Failed to save config to %s: %s", config_path, e)
         raise
@@ -6,25 +6,30 @@ APScheduler-based service for automated agent scheduling.
 Manages time-based start/stop of agents with crash recovery and manual override tracking.
 """
 
-import asyncio
 import logging
 import sys
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 # Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from .process_manager import get_manager  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
 # Constants
-MAX_CRASH_RETRIES = 3
-CRASH_BACKOFF_BASE = 10  # seconds
+# Restart delay (seconds) for each successive crash within a schedule window
+CRASH_BACKOFF_DELAYS: tuple[int, ...] = (10, 30, 90)
+MAX_CRASH_RETRIES = len(CRASH_BACKOFF_DELAYS)
 
 
 class SchedulerService:
@@ -301,10 +306,7 @@ class SchedulerService:
             return
 
         try:
-            from .process_manager import get_manager
-
-            root_dir = Path(__file__).parent.parent.parent
-            manager = get_manager(project_name, project_dir, root_dir)
+            manager = get_manager(project_name, project_dir, ROOT_DIR)
 
             if manager.status in ("running", "paused", "pausing", "paused_graceful"):
                 logger.info(
@@ -510,10 +512,7 @@ class SchedulerService:
 
     async def _start_agent(self, project_name: str, project_dir: Path, schedule):
         """Start the agent for a project."""
-        from .process_manager import get_manager
-
-        root_dir = Path(__file__).parent.parent.parent
-        manager = get_manager(project_name, project_dir, root_dir)
+        manager = get_manager(project_name, project_dir, ROOT_DIR)
 
         if manager.status in ("running", "paused"):
             logger.info(f"Agent already running for {project_name}, skipping scheduled start")
@@ -546,10 +545,7 @@ class SchedulerService:
 
     async def _stop_agent(self, project_name: str, project_dir: Path):
         """Stop the agent for a project."""
-        from .process_manager import get_manager
-
-        root_dir = Path(__file__).parent.parent.parent
-        manager = get_manager(project_name, project_dir, root_dir)
+        manager = get_manager(project_name, project_dir, ROOT_DIR)
 
         if manager.status not in ("running", "paused"):
             logger.info(f"Agent not running for {project_name}, skipping scheduled stop")
@@ -592,19 +588,57 @@ class SchedulerService:
                 db.commit()
 
                 # Exponential backoff: 10s, 30s, 90s
-                delay = CRASH_BACKOFF_BASE * (3 ** (schedule.crash_count - 1))
+                delay = CRASH_BACKOFF_DELAYS[schedule.crash_count - 1]
                 logger.info(
                     f"Restarting agent for {project_name} in {delay}s "
                     f"(attempt {schedule.crash_count})"
                 )
 
-                await asyncio.sleep(delay)
-                await self._start_agent(project_name, project_dir, schedule)
+                # Hand the wait to the shared APScheduler timer instead of
+                # parking a sleeping coroutine per crashed project
+                self.scheduler.add_job(
+                    self._handle_crash_restart,
+                    DateTrigger(run_date=now + timedelta(seconds=delay)),
+                    id=f"crash_restart_{project_name}",
+                    args=[project_name, schedule.id, str(project_dir)],
+                    replace_existing=True,
+                    misfire_grace_time=300,
+                )
                 return  # Only restart once
 
         finally:
             db.close()
 
+    async def _handle_crash_restart(
+        self, project_name: str, schedule_id: int, project_dir_str: str
+    ):
+        """Restart an agent once its crash backoff delay has elapsed."""
+        project_dir = Path(project_dir_str)
+
+        try:
+            from api.database import Schedule, create_database
+
+            _, SessionLocal = create_database(project_dir)
+            db = SessionLocal()
+
+            try:
+                schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+                if not schedule or not schedule.enabled:
+                    return
+
+                # The window may have closed while we were backing off
+                if not self._is_within_window(schedule, datetime.now(timezone.utc)):
+                    logger.info(f"Skipping crash restart for {project_name}: schedule window ended")
+                    return
+
+                await self._start_agent(project_name, project_dir, schedule)
+
+            finally:
+                db.close()
+
+        except Exception as e:
+            logger.error(f"Error restarting {project_name} after crash: {e}")
+
     def notify_manual_start(self, project_name: str, project_dir: Path):
         """Record manual start to prevent auto-stop."""
         logger.info(f"Manual start detected for {project_name}, creating override to prevent auto-stop")
@@ -815,13 +849,18 @@ class SchedulerService:
 
 # Global scheduler instance
 _scheduler: Optional[SchedulerService] = None
+_scheduler_lock = threading.Lock()
 
 
 def get_scheduler() -> SchedulerService:
-    """Get the global scheduler instance."""
+    """Get the global scheduler instance (thread-safe)."""
     global _scheduler
+    # Double-checked locking, as in registry._get_engine(): a call from a
+    # worker thread must never build a second AsyncIOScheduler
     if _scheduler is None:
-        _scheduler = SchedulerService()
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = SchedulerService()
     return _scheduler
 
 
@@ -9,13 +9,11 @@ Uses the create-spec.md skill to guide users through app spec creation.
 import json
 import logging
 import os
-import shutil
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional
 
-from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 from dotenv import load_dotenv
 
 from ..schemas import FileAttachment
@@ -24,11 +22,16 @@ from .chat_constants import (
     ROOT_DIR,
     build_attachment_content_blocks,
     check_rate_limit_error,
+    close_sessions,
+    find_claude_cli,
     format_client_init_error,
     make_multimodal_message,
     safe_receive_response,
 )
 
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeSDKClient
+
 # Load environment variables from .env file if present
 load_dotenv()
 
@@ -145,7 +148,7 @@ class SpecChatSession:
         # Create Claude SDK client with limited tools for spec creation
         # Use Opus for best quality spec generation
         # Use system Claude CLI to avoid bundled Bun runtime crash (exit code 3) on Windows
-        system_cli = shutil.which("claude")
+        system_cli = find_claude_cli()
 
         # Build environment overrides for API configuration
         from registry import DEFAULT_MODEL, get_effective_sdk_env, get_effort_setting
@@ -155,6 +158,10 @@ class SpecChatSession:
         # Determine model from SDK env (provider-aware) or fallback to env/default
         model = sdk_env.get("ANTHROPIC_DEFAULT_OPUS_MODEL") or os.getenv("ANTHROPIC_DEFAULT_OPUS_MODEL", DEFAULT_MODEL)
 
+        # Imported here rather than at module level: the SDK is slow to import
+        # and only needed once a chat session actually starts
+        from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
         try:
             self.client = ClaudeSDKClient(
                 options=ClaudeAgentOptions(
@@ -174,7 +181,7 @@ class SpecChatSession:
                     ],
                     permission_mode="acceptEdits",  # Auto-approve file writes for spec creation
                     max_turns=100,
-                    cwd=str(self.project_dir.resolve()),
+                    cwd=project_path,
                     settings=str(settings_file.resolve()),
                     env=sdk_env,
                 )
@@ -293,8 +300,6 @@ class SpecChatSession:
             # Text-only message: use string format
             await self.client.query(message)
 
-        current_text = ""
-
         # Track pending writes for BOTH required files
         pending_writes: dict[str, dict[str, Any] | None] = {
             "app_spec": None,      # {"tool_id": ..., "path": ...}
@@ -321,10 +326,9 @@ class SpecChatSession:
                         block_type = type(block).__name__
 
                         if block_type == "TextBlock" and hasattr(block, "text"):
-                            # Accumulate text and yield it
+                            # Yield text as it arrives
                             text = block.text
                             if text:
-                                current_text += text
                                 yield {"type": "text", "content": text}
 
                                 # Store in message history
@@ -438,16 +442,20 @@ class SpecChatSession:
         """Get all messages in the conversation."""
         return self.messages.copy()
 
+    def get_message_count(self) -> int:
+        """Get the number of messages without copying the conversation."""
+        return len(self.messages)
 
-# Session registry with thread safety
+
+# Session registry with thread safety. Mutations (pop + insert) hold the
+# lock; single dict reads are atomic under the GIL and skip it.
 _sessions: dict[str, SpecChatSession] = {}
 _sessions_lock = threading.Lock()
 
 
 def get_session(project_name: str) -> Optional[SpecChatSession]:
     """Get an existing session for a project."""
-    with _sessions_lock:
-        return _sessions.get(project_name)
+    return _sessions.get(project_name)
 
 
 async def create_session(project_name: str, project_dir: Path) -> SpecChatSession:
@@ -492,8 +500,7 @@ async def remove_session(project_name: str) -> None:
 
 def list_sessions() -> list[str]:
     """List all active session project names."""
-    with _sessions_lock:
-        return list(_sessions.keys())
+    return list(_sessions.keys())
 
 
 async def cleanup_all_sessions() -> None:
@@ -504,8 +511,4 @@ async def cleanup_all_sessions() -> None:
         sessions_to_close = list(_sessions.values())
         _sessions.clear()
 
-    for session in sessions_to_close:
-        try:
-            await session.close()
-        except Exception as e:
-            logger.warning(f"Error closing session {session.project_name}: {e}")
+    await close_sessions(sessions_to_close)
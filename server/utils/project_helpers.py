@@ -7,8 +7,12 @@ Consolidates the previously duplicated _get_project_path() function.
 """
 
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 
+from fastapi import HTTPException
+
 # Ensure the project root is on sys.path so `registry` can be imported.
 # This is necessary because `registry.py` lives at the repository root,
 # outside the `server` package.
@@ -30,3 +34,53 @@ def get_project_path(project_name: str) -> Path | None:
         project is not found in the registry.
     """
     return _registry_get_project_path(project_name)
+
+
+# Polled endpoints resolve the same project every few seconds; reuse the
+# registry lookup and directory check within this window.
+PROJECT_DIR_CACHE_SECONDS = 5
+
+
+@lru_cache(maxsize=256)
+def _lookup_project_dir(project_name: str, bucket: int) -> Path:
+    """Registry lookup plus existence check, cached per time bucket.
+
+    Misses raise instead of returning, and lru_cache does not memoize
+    exceptions, so only successful lookups are cached.
+    """
+    project_dir = _registry_get_project_path(project_name)
+
+    if project_dir is None:
+        raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found in registry")
+
+    if not project_dir.exists():
+        raise HTTPException(status_code=404, detail=f"Project directory not found: {project_dir}")
+
+    return project_dir
+
+
+def resolve_project_dir(project_name: str) -> Path:
+    """Look up an existing project directory, or raise ``HTTPException(404)``.
+
+    Successful lookups are cached for up to ``PROJECT_DIR_CACHE_SECONDS``;
+    call :func:`clear_project_dir_cache` after removing or moving a project.
+    Not-found results are never cached, so a project registered by another
+    process (e.g. ``start.py``) resolves immediately.
+
+    Args:
+        project_name: The registered (already validated) name of the project.
+
+    Returns:
+        The ``Path`` to the project directory.
+
+    Raises:
+        HTTPException: If the project is not registered or its directory
+            does not exist.
+    """
+    bucket = int(time.monotonic() // PROJECT_DIR_CACHE_SECONDS)
+    return _lookup_project_dir(project_name, bucket)
+
+
+def clear_project_dir_cache() -> None:
+    """Forget cached project directory lookups."""
+    _lookup_project_dir.cache_clear()
@@ -32,6 +32,7 @@ import sys
 import time
 import webbrowser
 from pathlib import Path
+from typing import Iterator
 
 # Fix Windows asyncio subprocess support BEFORE anything else runs
 if sys.platform == "win32":
@@ -41,6 +42,18 @@ ROOT = Path(__file__).parent.absolute()
 VENV_DIR = ROOT / "venv"
 UI_DIR = ROOT / "ui"
 
+# Config files in ui/ that should trigger a frontend rebuild when changed
+UI_CONFIG_FILES = (
+    "package.json",
+    "package-lock.json",
+    "vite.config.ts",
+    "tailwind.config.ts",
+    "tsconfig.json",
+    "tsconfig.node.json",
+    "postcss.config.js",
+    "index.html",
+)
+
 
 def print_step(step: int, total: int, message: str) -> None:
     """Print a formatted step message."""
@@ -164,6 +177,33 @@ def install_npm_deps() -> bool:
     return run_command([npm_cmd, "install"], cwd=UI_DIR)
 
 
+def _iter_file_mtimes(root: Path) -> Iterator[tuple[str, float]]:
+    """Yield (path, mtime) for every file under root.
+
+    Walks with os.scandir instead of Path.rglob: DirEntry reuses the file
+    type from readdir and no Path object is built per entry.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    # File was deleted or became inaccessible during iteration
+                    continue
+                yield entry.path, mtime
+
+
 def build_frontend() -> bool:
     """Build the React frontend if dist doesn't exist or is stale.
 
@@ -181,18 +221,6 @@ def build_frontend() -> bool:
     # false negatives when projects are on USB drives or SD cards
     TIMESTAMP_TOLERANCE = 2
 
-    # Config files that should trigger a rebuild when changed
-    CONFIG_FILES = [
-        "package.json",
-        "package-lock.json",
-        "vite.config.ts",
-        "tailwind.config.ts",
-        "tsconfig.json",
-        "tsconfig.node.json",
-        "postcss.config.js",
-        "index.html",
-    ]
-
     # Check if build is needed
     needs_build = False
     trigger_file = None
@@ -202,42 +230,29 @@ def build_frontend() -> bool:
         trigger_file = "dist/ directory missing"
     elif src_dir.exists():
         # Find the newest file in dist/ directory
-        newest_dist_mtime: float = 0
-        for dist_file in dist_dir.rglob("*"):
-            try:
-                if dist_file.is_file():
-                    file_mtime = dist_file.stat().st_mtime
-                    if file_mtime > newest_dist_mtime:
-                        newest_dist_mtime = file_mtime
-            except (FileNotFoundError, PermissionError, OSError):
-                # File was deleted or became inaccessible during iteration
-                continue
+        newest_dist_mtime = max((mtime for _, mtime in _iter_file_mtimes(dist_dir)), default=0.0)
 
         if newest_dist_mtime > 0:
             # Check config files first (these always require rebuild)
-            for config_name in CONFIG_FILES:
-                config_path = UI_DIR / config_name
+            ui_dir_str = str(UI_DIR)
+            for config_name in UI_CONFIG_FILES:
                 try:
-                    if config_path.exists():
-                        if config_path.stat().st_mtime > newest_dist_mtime + TIMESTAMP_TOLERANCE:
-                            needs_build = True
-                            trigger_file = config_name
-                            break
-                except (FileNotFoundError, PermissionError, OSError):
+                    config_mtime = os.stat(os.path.join(ui_dir_str, config_name)).st_mtime
+                except OSError:
+                    # Missing or inaccessible config files are simply skipped
                     continue
+                if config_mtime > newest_dist_mtime + TIMESTAMP_TOLERANCE:
+                    needs_build = True
+                    trigger_file = config_name
+                    break
 
             # Check source files if no config triggered rebuild
             if not needs_build:
-                for src_file in src_dir.rglob("*"):
-                    try:
-                        if src_file.is_file():
-                            if src_file.stat().st_mtime > newest_dist_mtime + TIMESTAMP_TOLERANCE:
-                                needs_build = True
-                                trigger_file = str(src_file.relative_to(UI_DIR))
-                                break
-                    except (FileNotFoundError, PermissionError, OSError):
-                        # File was deleted or became inaccessible during iteration
-                        continue
+                for src_path, src_mtime in _iter_file_mtimes(src_dir):
+                    if src_mtime > newest_dist_mtime + TIMESTAMP_TOLERANCE:
+                        needs_build = True
+                        trigger_file = os.path.relpath(src_path, UI_DIR)
+                        break
         else:
             # No files found in dist, need to rebuild
             needs_build = True
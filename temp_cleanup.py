@@ -16,9 +16,12 @@ Why this exists:
 When cleanup runs:
 - At Maestro startup (when you click Play or auto-restart after rate limits)
 - Only files/folders older than 1 hour are deleted (safe for running processes)
+- Repeat calls within 15 minutes of a full scan are skipped (sentinel file)
 """
 
+import fnmatch
 import logging
+import os
 import shutil
 import tempfile
 import time
@@ -29,6 +32,9 @@ logger = logging.getLogger(__name__)
 # Max age in seconds before a temp item is considered stale (1 hour)
 MAX_AGE_SECONDS = 3600
 
+# Marker file (in the user's ~/.autoforge dir) whose mtime records the last full scan
+CLEANUP_SENTINEL_NAME = ".temp_cleanup"
+
 # Directory patterns to clean up (glob patterns)
 DIR_PATTERNS = [
     "playwright_firefoxdev_profile-*",  # Playwright Firefox profiles
@@ -48,16 +54,35 @@ FILE_PATTERNS = [
 ]
 
 
-def cleanup_stale_temp(max_age_seconds: int = MAX_AGE_SECONDS) -> dict:
+def _get_cleanup_sentinel() -> Path:
+    """Get the sentinel file recording this user's last temp scan.
+
+    Kept in the user's AutoForge config dir rather than the shared temp dir,
+    where the first user to create it would own it and every other user's
+    scans would be skipped (and their touch() would fail).
+    """
+    from registry import get_config_dir
+
+    return get_config_dir() / CLEANUP_SENTINEL_NAME
+
+
+def cleanup_stale_temp(max_age_seconds: int = MAX_AGE_SECONDS, force: bool = False) -> dict:
     """
     Clean up stale temporary files and directories.
 
     Only deletes items older than max_age_seconds to avoid
     interfering with currently running processes.
 
+    The server, agent launcher and orchestrator all call this on startup,
+    usually within seconds of each other. A per-user sentinel file records
+    the last scan; if it is younger than a quarter of
+    max_age_seconds (capped at 1 hour) the scan is skipped, since nothing
+    new can have gone stale in between.
+
     Args:
         max_age_seconds: Maximum age in seconds before an item is deleted.
                         Defaults to 1 hour (3600 seconds).
+        force: Scan even if a recent cleanup was recorded.
 
     Returns:
         Dictionary with cleanup statistics:
@@ -76,41 +101,62 @@ def cleanup_stale_temp(max_age_seconds: int = MAX_AGE_SECONDS) -> dict:
         "errors": [],
     }
 
-    # Clean up directories
-    for pattern in DIR_PATTERNS:
-        for item in temp_dir.glob(pattern):
-            if not item.is_dir():
-                continue
-            try:
-                mtime = item.stat().st_mtime
-                if mtime < cutoff_time:
-                    size = _get_dir_size(item)
-                    shutil.rmtree(item, ignore_errors=True)
-                    if not item.exists():
-                        stats["dirs_deleted"] += 1
-                        stats["bytes_freed"] += size
-                        logger.debug(f"Deleted temp directory: {item}")
-            except Exception as e:
-                stats["errors"].append(f"Failed to delete {item}: {e}")
-                logger.debug(f"Failed to delete {item}: {e}")
-
-    # Clean up files
-    for pattern in FILE_PATTERNS:
-        for item in temp_dir.glob(pattern):
-            if not item.is_file():
-                continue
-            try:
-                mtime = item.stat().st_mtime
-                if mtime < cutoff_time:
-                    size = item.stat().st_size
-                    item.unlink(missing_ok=True)
-                    if not item.exists():
+    try:
+        sentinel: Path | None = _get_cleanup_sentinel()
+    except OSError as e:
+        sentinel = None  # Config dir unavailable - scan without a sentinel
+        logger.debug(f"Failed to locate cleanup sentinel: {e}")
+
+    min_interval = min(max_age_seconds / 4, 3600)
+    if not force and sentinel is not None:
+        try:
+            if time.time() - sentinel.stat().st_mtime < min_interval:
+                return stats
+        except OSError:
+            pass  # No sentinel yet (or unreadable) - run the scan
+
+    # Single directory scan instead of one glob per pattern. DirEntry caches
+    # the file type, and one stat() per entry serves both mtime and size.
+    try:
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _matches_any(name, DIR_PATTERNS):
+                            continue
+                        if entry.stat(follow_symlinks=False).st_mtime >= cutoff_time:
+                            continue
+                        size = _get_dir_size(Path(entry.path))
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                        if not os.path.exists(entry.path):
+                            stats["dirs_deleted"] += 1
+                            stats["bytes_freed"] += size
+                            logger.debug(f"Deleted temp directory: {entry.path}")
+                    elif entry.is_file(follow_symlinks=False):
+                        if not _matches_any(name, FILE_PATTERNS):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        if st.st_mtime >= cutoff_time:
+                            continue
+                        os.unlink(entry.path)
                         stats["files_deleted"] += 1
-                        stats["bytes_freed"] += size
-                        logger.debug(f"Deleted temp file: {item}")
-            except Exception as e:
-                stats["errors"].append(f"Failed to delete {item}: {e}")
-                logger.debug(f"Failed to delete {item}: {e}")
+                        stats["bytes_freed"] += st.st_size
+                        logger.debug(f"Deleted temp file: {entry.path}")
+                except FileNotFoundError:
+                    continue  # Removed by another process mid-scan
+                except Exception as e:
+                    stats["errors"].append(f"Failed to delete {entry.path}: {e}")
+                    logger.debug(f"Failed to delete {entry.path}: {e}")
+    except OSError as e:
+        stats["errors"].append(f"Failed to scan {temp_dir}: {e}")
+        logger.debug(f"Failed to scan {temp_dir}: {e}")
+
+    if sentinel is not None:
+        try:
+            sentinel.touch()
+        except OSError as e:
+            logger.debug(f"Failed to update cleanup sentinel {sentinel}: {e}")
 
     # Log summary if anything was cleaned
     if stats["dirs_deleted"] > 0 or stats["files_deleted"] > 0:
@@ -147,22 +193,28 @@ def cleanup_project_screenshots(project_dir: Path, max_age_seconds: int = 300) -
 
     # Clean up .playwright-cli/ directory (new CLI approach)
     playwright_cli_dir = project_dir / ".playwright-cli"
-    if playwright_cli_dir.exists():
-        for item in playwright_cli_dir.iterdir():
-            if not item.is_file():
-                continue
-            try:
-                mtime = item.stat().st_mtime
-                if mtime < cutoff_time:
-                    size = item.stat().st_size
-                    item.unlink(missing_ok=True)
-                    if not item.exists():
+    try:
+        with os.scandir(playwright_cli_dir) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_mtime < cutoff_time:
+                        os.unlink(entry.path)
                         stats["files_deleted"] += 1
-                        stats["bytes_freed"] += size
-                        logger.debug(f"Deleted playwright-cli artifact: {item}")
-            except Exception as e:
-                stats["errors"].append(f"Failed to delete {item}: {e}")
-                logger.debug(f"Failed to delete artifact {item}: {e}")
+                        stats["bytes_freed"] += st.st_size
+                        logger.debug(f"Deleted playwright-cli artifact: {entry.path}")
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    stats["errors"].append(f"Failed to delete {entry.path}: {e}")
+                    logger.debug(f"Failed to delete artifact {entry.path}: {e}")
+    except FileNotFoundError:
+        pass  # No artifacts directory yet
+    except OSError as e:
+        stats["errors"].append(f"Failed to scan {playwright_cli_dir}: {e}")
+        logger.debug(f"Failed to scan {playwright_cli_dir}: {e}")
 
     # Legacy cleanup: root-level screenshot patterns (from old MCP server approach)
     legacy_patterns = [
@@ -171,22 +223,30 @@ def cleanup_project_screenshots(project_dir: Path, max_age_seconds: int = 300) -
         "step-*.png",
     ]
 
-    for pattern in legacy_patterns:
-        for item in project_dir.glob(pattern):
-            if not item.is_file():
-                continue
-            try:
-                mtime = item.stat().st_mtime
-                if mtime < cutoff_time:
-                    size = item.stat().st_size
-                    item.unlink(missing_ok=True)
-                    if not item.exists():
+    try:
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                if not _matches_any(entry.name, legacy_patterns):
+                    continue
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_mtime < cutoff_time:
+                        os.unlink(entry.path)
                         stats["files_deleted"] += 1
-                        stats["bytes_freed"] += size
-                        logger.debug(f"Deleted legacy screenshot: {item}")
-            except Exception as e:
-                stats["errors"].append(f"Failed to delete {item}: {e}")
-                logger.debug(f"Failed to delete screenshot {item}: {e}")
+                        stats["bytes_freed"] += st.st_size
+                        logger.debug(f"Deleted legacy screenshot: {entry.path}")
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    stats["errors"].append(f"Failed to delete {entry.path}: {e}")
+                    logger.debug(f"Failed to delete screenshot {entry.path}: {e}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        stats["errors"].append(f"Failed to scan {project_dir}: {e}")
+        logger.debug(f"Failed to scan {project_dir}: {e}")
 
     if stats["files_deleted"] > 0:
         mb_freed = stats["bytes_freed"] / (1024 * 1024)
@@ -195,6 +255,11 @@ def cleanup_project_screenshots(project_dir: Path, max_age_seconds: int = 300) -
     return stats
 
 
+def _matches_any(name: str, patterns: list[str]) -> bool:
+    """Check a directory entry name against glob patterns (OS case rules)."""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
 def _get_dir_size(path: Path) -> int:
     """Get total size of a directory in bytes."""
     total = 0
@@ -214,7 +279,7 @@ if __name__ == "__main__":
     # Allow running directly for testing/manual cleanup
     logging.basicConfig(level=logging.DEBUG)
     print("Running temp cleanup...")
-    stats = cleanup_stale_temp()
+    stats = cleanup_stale_temp(force=True)
     mb_freed = stats["bytes_freed"] / (1024 * 1024)
     print(f"Cleanup complete: {stats['dirs_deleted']} dirs, {stats['files_deleted']} files, {mb_freed:.1f} MB freed")
     if stats["errors"]:
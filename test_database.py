@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Database Utility Tests
+======================
+
+Tests for helper functions in the api.database module.
+Run with: python test_database.py
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import mock_open, patch
+
+import api.database as database
+from api.database import _is_network_path, create_database, dispose_engine
+
+MOUNTS = """\
+/dev/sda1 / ext4 rw,relatime 0 0
+server:/export /mnt/share nfs4 rw,relatime 0 0
+/dev/sdb1 /mnt/share/local ext4 rw,relatime 0 0
+//nas/media /mnt/my\\040drive cifs rw 0 0
+"""
+
+
+@unittest.skipIf(sys.platform == "win32", "/proc/mounts is Linux-only")
+class TestIsNetworkPath(unittest.TestCase):
+    """Tests for _is_network_path mount-table matching."""
+
+    def _check(self, path: str, mounts: str = MOUNTS) -> bool:
+        with patch("builtins.open", mock_open(read_data=mounts)):
+            return _is_network_path(Path(path))
+
+    def test_local_root(self):
+        self.assertFalse(self._check("/home/user/project"))
+
+    def test_under_network_mount(self):
+        self.assertTrue(self._check("/mnt/share/project"))
+
+    def test_network_mount_point_itself(self):
+        self.assertTrue(self._check("/mnt/share"))
+
+    def test_local_mount_nested_in_network_mount(self):
+        self.assertFalse(self._check("/mnt/share/local/project"))
+
+    def test_prefix_without_separator_boundary(self):
+        self.assertFalse(self._check("/mnt/shared/project"))
+
+    def test_escaped_space_in_mount_point(self):
+        self.assertTrue(self._check("/mnt/my drive/project"))
+
+    def test_later_mount_shadows_earlier(self):
+        mounts = MOUNTS + "/dev/sdc1 /mnt/share ext4 rw 0 0\n"
+        self.assertFalse(self._check("/mnt/share/project", mounts))
+
+
+class TestEngineCache(unittest.TestCase):
+    """Tests for the bounded per-project engine cache."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self._tmpdir.name)
+        self.projects = [root / f"p{i}" for i in range(3)]
+        for project in self.projects:
+            project.mkdir()
+
+        patcher = patch("api.database.MAX_CACHED_ENGINES", 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        for project in self.projects:
+            dispose_engine(project)
+        self._tmpdir.cleanup()
+
+    def _cached_keys(self) -> list[str]:
+        return [k for k in database._engine_cache if k in {p.as_posix() for p in self.projects}]
+
+    def test_repeat_calls_return_cached_engine(self):
+        engine, session_maker = create_database(self.projects[0])
+        again = create_database(self.projects[0])
+        self.assertIs(again[0], engine)
+        self.assertIs(again[1], session_maker)
+
+    def test_eviction_disposes_least_recently_used(self):
+        p0, p1, p2 = self.projects
+        engine0, _ = create_database(p0)
+        create_database(p1)
+        create_database(p0)  # p0 is now the most recently used
+
+        with patch.object(database._engine_cache[p1.as_posix()][0], "dispose") as dispose1:
+            create_database(p2)
+
+        dispose1.assert_called_once()
+        self.assertEqual(self._cached_keys(), [p0.as_posix(), p2.as_posix()])
+        self.assertIs(create_database(p0)[0], engine0)
+
+    def test_evicted_engine_in_use_is_revived(self):
+        p0, p1, p2 = self.projects
+        engine0, _ = create_database(p0)
+        create_database(p1)
+        create_database(p2)  # evicts p0 while we still hold engine0
+        self.assertNotIn(p0.as_posix(), database._engine_cache)
+
+        self.assertIs(create_database(p0)[0], engine0)
+
+    def test_dispose_engine_releases_evicted_engine_in_use(self):
+        p0, p1, p2 = self.projects
+        engine0, _ = create_database(p0)
+        create_database(p1)
+        create_database(p2)
+
+        with patch.object(engine0, "dispose") as dispose0:
+            self.assertTrue(dispose_engine(p0))
+        dispose0.assert_called_once()
+        self.assertFalse(dispose_engine(p0))
+
+
+if __name__ == "__main__":
+    unittest.main()
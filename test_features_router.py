@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Features Router Tests
+=====================
+
+Tests for the features router's cached list and graph reads.
+Run with: python test_features_router.py
+"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import server.routers.features as features
+from api.database import Feature, create_database, dispose_engine
+from server.schemas import FeatureCreate
+
+PROJECT = "cache-test"
+
+
+class TestReadCache(unittest.TestCase):
+    """_cached must never serve reads that miss a change to features.db."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.project_dir = Path(self._tmpdir.name)
+        _, self.session_maker = create_database(self.project_dir)
+
+        patcher = patch.object(features, "_resolve_project_dir", return_value=self.project_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        features._invalidate_cache(PROJECT)
+        dispose_engine(self.project_dir)
+        self._tmpdir.cleanup()
+
+    def _list_names(self) -> list[str]:
+        response = asyncio.run(features.list_features(PROJECT))
+        return [f.name for f in response.pending]
+
+    def _graph_names(self) -> list[str]:
+        response = asyncio.run(features.get_dependency_graph(PROJECT))
+        return [node.name for node in response.nodes]
+
+    def _insert_externally(self, name: str) -> None:
+        """Write a feature the way the agent's MCP server does, bypassing the router."""
+        session = self.session_maker()
+        try:
+            session.add(Feature(priority=1, category="core", name=name, description="d", steps=[]))
+            session.commit()
+        finally:
+            session.close()
+
+    def test_router_write_visible_on_next_read(self):
+        # Freeze the signature so only the router's invalidation can help
+        with patch.object(features, "_features_db_signature", return_value=("frozen",)):
+            self.assertEqual(self._list_names(), [])
+            self.assertEqual(self._graph_names(), [])
+
+            feature = FeatureCreate(category="core", name="Login", description="d", steps=[])
+            asyncio.run(features.create_feature(PROJECT, feature))
+
+            self.assertEqual(self._list_names(), ["Login"])
+            self.assertEqual(self._graph_names(), ["Login"])
+
+    def test_external_write_changes_signature(self):
+        self.assertEqual(self._list_names(), [])
+        before = features._features_db_signature(self.project_dir)
+
+        self._insert_externally("Signup")
+
+        self.assertNotEqual(features._features_db_signature(self.project_dir), before)
+        self.assertEqual(self._list_names(), ["Signup"])
+
+    def test_ttl_expires_entry_with_unchanged_signature(self):
+        clock = [1000.0]
+        with (
+            patch.object(features, "_features_db_signature", return_value=("frozen",)),
+            patch.object(features.time, "monotonic", side_effect=lambda: clock[0]),
+        ):
+            self.assertEqual(self._list_names(), [])
+            self._insert_externally("Search")
+
+            # Within the TTL the stale entry is still served
+            clock[0] += features.READ_CACHE_TTL_SECONDS / 2
+            self.assertEqual(self._list_names(), [])
+
+            clock[0] += features.READ_CACHE_TTL_SECONDS
+            self.assertEqual(self._list_names(), ["Search"])
+
+
+if __name__ == "__main__":
+    unittest.main()
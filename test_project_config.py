@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Project Config Tests
+====================
+
+Tests for the cached project config loader.
+Run with: python test_project_config.py
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from server.services.project_config import _config_cache, _load_config, _save_config
+
+
+class TestLoadConfigCache(unittest.TestCase):
+    """_load_config must notice edits to config.json."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.project_dir = Path(self._tmpdir.name)
+        self.config_path = self.project_dir / ".autoforge" / "config.json"
+        self.config_path.parent.mkdir()
+
+    def tearDown(self):
+        _config_cache.pop(str(self.config_path), None)
+        self._tmpdir.cleanup()
+
+    def _write(self, config: dict, mtime_ns: int) -> None:
+        self.config_path.write_text(json.dumps(config), encoding="utf-8")
+        os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def test_missing_config(self):
+        self.assertEqual(_load_config(self.project_dir), {})
+
+    def test_external_edit_invalidates_cache(self):
+        self._write({"dev_command": "npm run dev"}, 1_000_000_000_000_000_000)
+        self.assertEqual(_load_config(self.project_dir), {"dev_command": "npm run dev"})
+
+        # Same size, different mtime: only the stat stamp changes
+        self._write({"dev_command": "npm run go!"}, 1_000_000_001_000_000_000)
+        self.assertEqual(_load_config(self.project_dir), {"dev_command": "npm run go!"})
+
+    def test_save_invalidates_cache(self):
+        self._write({"dev_command": "a"}, 1_000_000_000_000_000_000)
+        self.assertEqual(_load_config(self.project_dir)["dev_command"], "a")
+
+        _save_config(self.project_dir, {"dev_command": "b"})
+        # Pin the mtime back so only the explicit invalidation can help
+        os.utime(self.config_path, ns=(1_000_000_000_000_000_000,) * 2)
+        self.assertEqual(_load_config(self.project_dir)["dev_command"], "b")
+
+    def test_returned_dict_does_not_alias_cache(self):
+        self._write({"dev_command": "a"}, 1_000_000_000_000_000_000)
+        config = _load_config(self.project_dir)
+        config["dev_command"] = "changed"
+        self.assertEqual(_load_config(self.project_dir)["dev_command"], "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Registry Tests
+==============
+
+Tests for the registry's cached reads and their invalidation.
+Run with: python test_registry.py
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import HTTPException
+
+import registry
+from server.utils.project_helpers import clear_project_dir_cache, resolve_project_dir
+
+
+class RegistryTestCase(unittest.TestCase):
+    """Points the registry singleton at a throwaway database."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+
+        self._orig_engine = (registry._engine, registry._SessionLocal)
+        registry._engine = None
+        registry._SessionLocal = None
+        registry._settings_cache = None
+
+        patcher = patch("registry.get_registry_path", return_value=self.tmp_path / "registry.db")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        if registry._engine is not None:
+            registry._engine.dispose()
+        registry._engine, registry._SessionLocal = self._orig_engine
+        registry._settings_cache = None
+        clear_project_dir_cache()
+        self._tmpdir.cleanup()
+
+
+class TestSettingsCache(RegistryTestCase):
+    """set_setting must invalidate the cached get_all_settings() result."""
+
+    def test_set_then_get_returns_new_value(self):
+        self.assertIsNone(registry.get_setting("batch_size"))
+
+        registry.set_setting("batch_size", "2")
+        self.assertEqual(registry.get_setting("batch_size"), "2")
+
+        registry.set_setting("batch_size", "5")
+        self.assertEqual(registry.get_setting("batch_size"), "5")
+        self.assertEqual(registry.get_all_settings()["batch_size"], "5")
+
+    def test_returned_dict_does_not_alias_cache(self):
+        registry.set_setting("api_base_url", "http://localhost:1234")
+        settings = registry.get_all_settings()
+        settings["api_base_url"] = "changed"
+        self.assertEqual(registry.get_setting("api_base_url"), "http://localhost:1234")
+
+
+class TestResolveProjectDir(RegistryTestCase):
+    """clear_project_dir_cache must make newly registered projects resolvable."""
+
+    def test_register_then_clear_makes_project_resolvable(self):
+        project_dir = self.tmp_path / "my-app"
+        project_dir.mkdir()
+
+        with self.assertRaises(HTTPException) as ctx:
+            resolve_project_dir("my-app")
+        self.assertEqual(ctx.exception.status_code, 404)
+
+        registry.register_project("my-app", project_dir)
+        clear_project_dir_cache()
+
+        self.assertEqual(resolve_project_dir("my-app"), project_dir.resolve())
+
+    def test_not_found_is_not_cached(self):
+        # A project registered by another process (e.g. start.py) must
+        # resolve without anyone calling clear_project_dir_cache()
+        project_dir = self.tmp_path / "cli-app"
+        project_dir.mkdir()
+
+        with self.assertRaises(HTTPException):
+            resolve_project_dir("cli-app")
+
+        registry.register_project("cli-app", project_dir)
+
+        self.assertEqual(resolve_project_dir("cli-app"), project_dir.resolve())
+
+
+if __name__ == "__main__":
+    unittest.main()
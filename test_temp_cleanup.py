@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Temp Cleanup Tests
+==================
+
+Tests for the stale temp file cleanup and its scan sentinel.
+Run with: python test_temp_cleanup.py
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import temp_cleanup
+from temp_cleanup import cleanup_stale_temp
+
+
+class TestCleanupSentinel(unittest.TestCase):
+    """Tests for skipping repeat scans via the per-user sentinel."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self._tmpdir.name)
+        self.temp_dir = root / "tmp"
+        self.temp_dir.mkdir()
+        self.sentinel = root / "home" / ".autoforge" / temp_cleanup.CLEANUP_SENTINEL_NAME
+        self.sentinel.parent.mkdir(parents=True)
+
+        patchers = [
+            patch("temp_cleanup.tempfile.gettempdir", return_value=str(self.temp_dir)),
+            patch("temp_cleanup._get_cleanup_sentinel", return_value=self.sentinel),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def _make_stale_file(self, name: str) -> Path:
+        path = self.temp_dir / name
+        path.write_bytes(b"x" * 10)
+        old = time.time() - 2 * temp_cleanup.MAX_AGE_SECONDS
+        os.utime(path, (old, old))
+        return path
+
+    def test_first_scan_deletes_and_creates_sentinel(self):
+        stale = self._make_stale_file(".abc123.node")
+        stats = cleanup_stale_temp()
+        self.assertEqual(stats["files_deleted"], 1)
+        self.assertFalse(stale.exists())
+        self.assertTrue(self.sentinel.exists())
+
+    def test_recent_scan_is_skipped(self):
+        cleanup_stale_temp()
+        stale = self._make_stale_file(".def456.node")
+        stats = cleanup_stale_temp()
+        self.assertEqual(stats["files_deleted"], 0)
+        self.assertTrue(stale.exists())
+
+    def test_force_scans_despite_recent_sentinel(self):
+        cleanup_stale_temp()
+        stale = self._make_stale_file(".def456.node")
+        stats = cleanup_stale_temp(force=True)
+        self.assertEqual(stats["files_deleted"], 1)
+        self.assertFalse(stale.exists())
+
+    def test_old_sentinel_does_not_skip(self):
+        cleanup_stale_temp()
+        old = time.time() - temp_cleanup.MAX_AGE_SECONDS
+        os.utime(self.sentinel, (old, old))
+        stale = self._make_stale_file(".def456.node")
+        stats = cleanup_stale_temp()
+        self.assertEqual(stats["files_deleted"], 1)
+        self.assertFalse(stale.exists())
+
+    def test_fresh_files_are_kept(self):
+        fresh = self.temp_dir / ".fresh.node"
+        fresh.write_bytes(b"x")
+        cleanup_stale_temp(force=True)
+        self.assertTrue(fresh.exists())
+
+
+class TestSentinelLocation(unittest.TestCase):
+    """The sentinel lives in the per-user config dir, not the shared temp dir."""
+
+    def test_sentinel_is_in_config_dir(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("registry.get_config_dir", return_value=Path(tmp)):
+                sentinel = temp_cleanup._get_cleanup_sentinel()
+        self.assertEqual(sentinel, Path(tmp) / temp_cleanup.CLEANUP_SENTINEL_NAME)
+        self.assertNotEqual(sentinel.parent, Path(tempfile.gettempdir()))
+
+    def test_unavailable_config_dir_still_scans(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            stale = Path(tmp) / ".abc123.node"
+            stale.write_bytes(b"x")
+            old = time.time() - 2 * temp_cleanup.MAX_AGE_SECONDS
+            os.utime(stale, (old, old))
+            with (
+                patch("temp_cleanup.tempfile.gettempdir", return_value=tmp),
+                patch("registry.get_config_dir", side_effect=PermissionError("read-only home")),
+            ):
+                stats = cleanup_stale_temp()
+            self.assertEqual(stats["files_deleted"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()